@@ -6,23 +6,93 @@ structure (headings, sections, footnotes) and identifying document
 components (caption, facts, arguments, etc.).
 """
 
+import bisect
+import functools
+import multiprocessing
+import os
 import re
-import uuid
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 from docx import Document
 from docx.document import Document as DocxDocument
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
 from docx.text.paragraph import Paragraph
 import pdfplumber
 
+# RE2 is optional: it gives linear-time matching for the scans that run
+# over whole briefs. Without it we fall back to the standard re module.
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 from .models import (
     Brief, BriefSection, ArgumentChunk, Citation,
     SectionType, ProceduralPosture
 )
 
 
+# Python's \s also matches Unicode whitespace (e.g. the non-breaking
+# spaces common in briefs) while RE2's is ASCII-only; this class is the
+# RE2 spelling of Python's set.
+_RE2_SPACE = r"\t\n\x0b\f\r \x1c-\x1f\x85\pZ"
+
+
+def _to_re2(pattern: str) -> str:
+    r"""
+    Rewrite a Python pattern for RE2.
+
+    \s is replaced so RE2 matches the same characters, and possessive
+    quantifiers (which RE2 lacks and, never backtracking, has no need for)
+    are turned back into plain ones.
+    """
+    out = []
+    in_class = False
+    after_quantifier = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            token = pattern[i:i + 2]
+            if token == r"\s":
+                out.append(_RE2_SPACE if in_class else f"[{_RE2_SPACE}]")
+            else:
+                out.append(token)
+            after_quantifier = False
+            i += 2
+            continue
+        if char == "+" and after_quantifier:
+            after_quantifier = False
+            i += 1
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+        elif char == "]" and in_class:
+            in_class = False
+        after_quantifier = not in_class and char in "+*?}"
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def _compile_bulk(pattern: str):
+    """
+    Compile a pattern that is run over full brief text.
+
+    Uses RE2 when available so matching time stays linear regardless of
+    input. RE2 takes no flags argument, so bulk patterns must not need any.
+    """
+    if re2 is not None:
+        return re2.compile(_to_re2(pattern))
+    return re.compile(pattern)
+
+
 # Patterns for identifying brief sections
 SECTION_PATTERNS = {
     SectionType.INTRODUCTION: [
@@ -59,6 +129,24 @@ SECTION_PATTERNS = {
     ],
 }
 
+# Minimum pages each worker process gets when extracting PDF text in
+# parallel; shorter documents are extracted in-process since starting
+# workers costs more than it saves
+PDF_PAGES_PER_WORKER = 10
+
+# Cleared in parse_documents' worker processes: each already parses a whole
+# document, so extracting its pages in a further pool would oversubscribe
+_parallel_pdf_pages = True
+
+# Worker processes that PDF page ranges are extracted in, started on first
+# use and shared by every document, so concurrent uploads queue for
+# os.cpu_count() workers instead of each starting its own. A forked child
+# gets an unusable copy of the pool, so it starts afresh.
+_pdf_page_pool: Optional[ProcessPoolExecutor] = None
+_pdf_page_pool_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=lambda: globals().update(_pdf_page_pool=None))
+
 # Pattern for argument sub-sections (roman numerals, letters, numbers)
 ARGUMENT_HEADING_PATTERNS = [
     r"^[IVX]+\.\s+.+",  # Roman numerals: I. , II. , etc.
@@ -66,23 +154,243 @@ ARGUMENT_HEADING_PATTERNS = [
     r"^\d+\.\s+.+",     # Numbers: 1. , 2. , etc.
 ]
 
-# Citation pattern - matches standard legal citations
-CITATION_PATTERN = re.compile(
-    r"([A-Z][a-zA-Z\'\-\s]+(?:v\.|vs\.)\s+[A-Z][a-zA-Z\'\-\s]+),?\s*"
-    r"(\d+)\s+"
-    r"([A-Z][a-zA-Z\.\s\d]+?)\s+"
-    r"(\d+)"
-    r"(?:\s*,\s*(\d+))?"  # Optional pinpoint
-    r"\s*\(([^)]+)\s+(\d{4})\)",
+# All section patterns fused into one alternation so a heading is
+# classified with a single match() call. Alternatives are tried in the
+# same order as SECTION_PATTERNS, so the first matching type still wins.
+# Group names map back to their SectionType via SECTION_RE_GROUPS.
+SECTION_RE_GROUPS = {
+    f"{section_type.name}_{i}": section_type
+    for section_type, patterns in SECTION_PATTERNS.items()
+    for i in range(len(patterns))
+}
+SECTION_RE = re.compile("|".join(
+    f"(?P<{section_type.name}_{i}>{pattern})"
+    for section_type, patterns in SECTION_PATTERNS.items()
+    for i, pattern in enumerate(patterns)
+))
+ARGUMENT_HEADING_RE = re.compile("|".join(
+    f"(?:{pattern})" for pattern in ARGUMENT_HEADING_PATTERNS
+))
+
+# The literal word each section pattern opens with ("I", "STATEMENT", ...).
+# A heading that starts with none of them cannot match SECTION_RE, which
+# str.startswith rules out far more cheaply than the regex engine.
+_SECTION_LITERAL_PREFIXES = tuple(sorted({
+    re.match(r"\^([A-Z]+)", pattern).group(1)
+    for patterns in SECTION_PATTERNS.values()
+    for pattern in patterns
+}))
+
+# Patterns for sub-headings within an argument section
+ARGUMENT_SUBHEADING_PATTERNS = [
+    r"^[A-Z]\.\s+.+",         # A. , B. , etc.
+    r"^\d+\.\s+.+",           # 1. , 2. , etc.
+    r"^(?i:[ivx]+)\.\s+.+",   # roman numerals
+]
+
+
+def _line_heading_pattern(pattern: str) -> str:
+    """
+    Adapt a heading pattern written for one stripped line so it can be
+    run with re.MULTILINE over a whole document: whitespace may not cross
+    a newline, and trailing whitespace that strip() would have removed
+    doesn't count towards a trailing ".+".
+    """
+    if pattern.startswith("^"):
+        pattern = pattern[1:]
+    pattern = pattern.replace(r"\s", r"[^\S\n]")
+    if pattern.endswith(".+"):
+        pattern = pattern[:-2] + r".*\S"
+    return pattern
+
+
+# Finds every heading line of a PDF in one scan. Section patterns are
+# tried first (case-insensitively, as identify_section_type upper-cases
+# them), then argument sub-headings, mirroring identify_section_type.
+PDF_HEADING_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    + "|".join(
+        f"(?P<{section_type.name}_{i}>(?i:{_line_heading_pattern(pattern)}))"
+        for section_type, patterns in SECTION_PATTERNS.items()
+        for i, pattern in enumerate(patterns)
+    )
+    + "|(?P<ARGUMENT_HEADING>"
+    + "|".join(_line_heading_pattern(p) for p in ARGUMENT_HEADING_PATTERNS)
+    + "))",
     re.MULTILINE
 )
+PDF_HEADING_GROUPS = {**SECTION_RE_GROUPS, "ARGUMENT_HEADING": SectionType.ARGUMENT}
 
-# Simpler citation pattern for cases we might miss
-SIMPLE_CITATION_PATTERN = re.compile(
-    r"([A-Z][a-zA-Z\'\-\s]+(?:v\.|vs\.)\s+[A-Z][a-zA-Z\'\-\s,]+\d{4}\))",
+ARGUMENT_SUBHEADING_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    + "|".join(_line_heading_pattern(p) for p in ARGUMENT_SUBHEADING_PATTERNS)
+    + ")",
     re.MULTILINE
 )
 
+# Procedural posture patterns, matched against lowercased brief text
+PROCEDURAL_PATTERNS = [
+    (ProceduralPosture.MOTION_TO_DISMISS, [
+        r"motion\s+to\s+dismiss",
+        r"12\(b\)\(6\)",
+        r"failure\s+to\s+state\s+a\s+claim"
+    ]),
+    (ProceduralPosture.SUMMARY_JUDGMENT, [
+        r"motion\s+for\s+summary\s+judgment",
+        r"summary\s+judgment",
+        r"rule\s+56"
+    ]),
+    (ProceduralPosture.PRELIMINARY_INJUNCTION, [
+        r"preliminary\s+injunction",
+        r"temporary\s+restraining\s+order",
+        r"tro"
+    ]),
+    (ProceduralPosture.MOTION_TO_COMPEL, [
+        r"motion\s+to\s+compel"
+    ]),
+    (ProceduralPosture.OPPOSITION, [
+        r"opposition\s+to",
+        r"in\s+opposition"
+    ]),
+    (ProceduralPosture.REPLY, [
+        r"reply\s+in\s+support",
+        r"reply\s+brief",
+        r"reply\s+memorandum"
+    ]),
+    (ProceduralPosture.APPEAL_BRIEF, [
+        r"appellant[\'s]*\s+brief",
+        r"appellee[\'s]*\s+brief",
+        r"opening\s+brief",
+        r"answering\s+brief"
+    ]),
+]
+# One alternation over every posture pattern; group names encode the
+# posture's priority (its index in PROCEDURAL_PATTERNS)
+PROCEDURAL_RE = _compile_bulk("|".join(
+    f"(?P<p{priority}_{i}>{pattern})"
+    for priority, (_, patterns) in enumerate(PROCEDURAL_PATTERNS)
+    for i, pattern in enumerate(patterns)
+))
+
+# Court and jurisdiction patterns. These and the case number patterns are
+# written in lowercase and run against lowercased text (see
+# _lower_preserving_offsets) instead of using re.IGNORECASE, which is several
+# times slower on a full brief.
+COURT_DISTRICT_RE = re.compile(
+    r"((?:northern|southern|eastern|western|central|middle)\s+district\s+of\s+\w+)"
+)
+COURT_CIRCUIT_RE = re.compile(
+    r"(\d+(?:st|nd|rd|th)\s+circuit|(?:first|second|third|fourth|fifth|sixth|seventh|eighth|ninth|tenth|eleventh|d\.?c\.?)\s+circuit)"
+)
+COURT_STATE_RE = re.compile(
+    r"(?:superior\s+court|supreme\s+court|court\s+of\s+appeal)\s+of\s+(?:the\s+state\s+of\s+)?(\w+)"
+)
+
+# Case number patterns, tried in order
+CASE_NUMBER_PATTERNS = [
+    re.compile(r"case\s+no\.?\s*:?\s*([\w\-:]+)"),
+    re.compile(r"no\.?\s+([\d\-cv\w]+)"),
+    re.compile(r"docket\s+no\.?\s*:?\s*([\w\-]+)"),
+]
+
+# Case name patterns, tried in order against the caption area
+CASE_NAME_PATTERNS = [
+    # Pattern with Plaintiff/Defendant labels (most reliable). IGNORECASE
+    # makes [A-Z] match either case, so this also covers mixed-case names.
+    re.compile(
+        r"([A-Z][A-Z\s\.,\'\-]+?)\s*,\s*Plaintiffs?\s*,?\s*v\.?\s+([A-Z][A-Z\s\.,\'\-]+?)\s*,\s*Defendants?",
+        re.MULTILINE | re.IGNORECASE
+    ),
+    # All caps: NAME v. NAME (but require comma or newline after defendant to avoid grabbing too much)
+    re.compile(
+        r"([A-Z][A-Z\s\.,\'\-]{2,50}?)\s+v\.\s+([A-Z][A-Z\s\.,\'\-]{2,50}?)(?:\s*,|\s*\n|$)",
+        re.MULTILINE | re.IGNORECASE
+    ),
+]
+
+# Words/phrases that indicate we've captured court info, not party names
+COURT_INDICATORS = [
+    'district', 'court', 'circuit', 'united states', 'state of',
+    'superior', 'supreme', 'appellate', 'northern', 'southern',
+    'eastern', 'western', 'central', 'middle'
+]
+
+# Citation pattern - matches standard legal citations
+# Quantifiers are possessive wherever the next token can never match what
+# they consumed, so the re fallback cannot backtrack into them; the first
+# party name, the reporter and the parenthetical need to backtrack and
+# keep ordinary quantifiers.
+CITATION_PATTERN = _compile_bulk(
+    r"([A-Z][a-zA-Z\'\-\s]+(?:v\.|vs\.)\s++[A-Z][a-zA-Z\'\-\s]++),?\s*+"
+    r"(\d++)\s++"
+    r"([A-Z][a-zA-Z\.\s\d]+?)\s++"
+    r"(\d++)"
+    r"(?:\s*+,\s*+(\d++))?"  # Optional pinpoint
+    r"\s*+\(([^)]+)\s+(\d{4})\)"
+)
+
+# Simpler citation pattern for cases we might miss
+SIMPLE_CITATION_PATTERN = _compile_bulk(
+    r"([A-Z][a-zA-Z\'\-\s]+(?:v\.|vs\.)\s+[A-Z][a-zA-Z\'\-\s,]+\d{4}\))"
+)
+
+
+# IDs are handed out from a pool filled by a single os.urandom call,
+# rather than one call per uuid.uuid4()
+_ID_BATCH_SIZE = 256
+_id_pool: list[str] = []
+_id_pool_lock = threading.Lock()
+# A forked child must not hand out the same IDs as its parent
+os.register_at_fork(after_in_child=_id_pool.clear)
+
+
+def _new_id() -> str:
+    """Return a random ID in the same format as str(uuid.uuid4())."""
+    with _id_pool_lock:
+        if not _id_pool:
+            buf = bytearray(os.urandom(16 * _ID_BATCH_SIZE))
+            # Set the version (4) and variant (RFC 4122) bits of each UUID
+            buf[6::16] = bytes((b & 0x0F) | 0x40 for b in buf[6::16])
+            buf[8::16] = bytes((b & 0x3F) | 0x80 for b in buf[8::16])
+            h = buf.hex()
+            _id_pool.extend(
+                f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-"
+                f"{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+                for i in range(0, len(h), 32)
+            )
+        return _id_pool.pop()
+
+
+def _citation_from_match(
+    match,
+    text: str,
+    chunk_id: str,
+    lower: int = 0,
+    upper: Optional[int] = None
+) -> Citation:
+    """Build a Citation from a CITATION_PATTERN match within text[lower:upper]."""
+    if upper is None:
+        upper = len(text)
+
+    # Get context (surrounding sentence)
+    start = max(lower, match.start() - 100)
+    end = min(upper, match.end() + 100)
+    context = text[start:end]
+
+    return Citation(
+        id=_new_id(),
+        full_text=match.group(0),
+        case_name=match.group(1).strip(),
+        volume=match.group(2),
+        reporter=match.group(3).strip(),
+        page=match.group(4),
+        pinpoint=match.group(5),
+        court=match.group(6),
+        year=int(match.group(7)) if match.group(7) else None,
+        parent_chunk_id=chunk_id,
+        context=context.strip()
+    )
+
 
 def extract_citations(text: str, chunk_id: str) -> list[Citation]:
     """Extract legal citations from text."""
@@ -95,191 +403,259 @@ def extract_citations(text: str, chunk_id: str) -> list[Citation]:
             continue
         seen.add(full_text)
 
-        # Get context (surrounding sentence)
-        start = max(0, match.start() - 100)
-        end = min(len(text), match.end() + 100)
-        context = text[start:end]
-
-        citation = Citation(
-            id=str(uuid.uuid4()),
-            full_text=full_text,
-            case_name=match.group(1).strip(),
-            volume=match.group(2),
-            reporter=match.group(3).strip(),
-            page=match.group(4),
-            pinpoint=match.group(5),
-            court=match.group(6),
-            year=int(match.group(7)) if match.group(7) else None,
-            parent_chunk_id=chunk_id,
-            context=context.strip()
+        citations.append(_citation_from_match(match, text, chunk_id))
+
+    return citations
+
+
+# Placed between chunk contents when scanning them as one buffer. No part
+# of CITATION_PATTERN can match across it: the only ")" is preceded by a
+# NUL, so the closing "year)" of a citation can never land on it.
+_CHUNK_SEPARATOR = "\x00)\n"
+
+
+def extract_chunk_citations(chunks: list[ArgumentChunk]) -> list[Citation]:
+    """
+    Extract citations for a list of chunks in a single regex pass.
+
+    Chunk contents are scanned as one buffer and each match is assigned
+    to its chunk by offset, so the cost is linear in the brief length
+    no matter how many chunks there are. Sets ``chunk.citations`` on
+    every chunk and returns all extracted citations in chunk order.
+    """
+    if not chunks:
+        return []
+
+    # Start offset of each chunk within the combined buffer
+    starts = []
+    offset = 0
+    for chunk in chunks:
+        starts.append(offset)
+        offset += len(chunk.content) + len(_CHUNK_SEPARATOR)
+    buffer = _CHUNK_SEPARATOR.join(chunk.content for chunk in chunks)
+
+    citations = []
+    seen: list[set[str]] = [set() for _ in chunks]
+    for chunk in chunks:
+        chunk.citations = []
+
+    for match in CITATION_PATTERN.finditer(buffer):
+        index = bisect.bisect_right(starts, match.start()) - 1
+        full_text = match.group(0)
+        if full_text in seen[index]:
+            continue
+        seen[index].add(full_text)
+
+        chunk = chunks[index]
+        lower = starts[index]
+        citation = _citation_from_match(
+            match, buffer, chunk.id, lower, lower + len(chunk.content)
         )
+        chunk.citations.append(citation.id)
         citations.append(citation)
 
     return citations
 
 
+@functools.lru_cache(maxsize=4096)
 def identify_section_type(heading: str) -> SectionType:
-    """Identify what type of section a heading represents."""
+    """
+    Identify what type of section a heading represents.
+
+    Results are cached: briefs share a small vocabulary of headings
+    ("ARGUMENT", "CONCLUSION", ...), so across an ingestion batch most
+    calls are repeats.
+    """
     heading_upper = heading.upper().strip()
 
-    for section_type, patterns in SECTION_PATTERNS.items():
-        for pattern in patterns:
-            if re.match(pattern, heading_upper):
-                return section_type
+    if heading_upper.startswith(_SECTION_LITERAL_PREFIXES):
+        match = SECTION_RE.match(heading_upper)
+        if match:
+            return SECTION_RE_GROUPS[match.lastgroup]
 
     # Check if it's an argument sub-heading
-    for pattern in ARGUMENT_HEADING_PATTERNS:
-        if re.match(pattern, heading.strip()):
-            return SectionType.ARGUMENT
+    if ARGUMENT_HEADING_RE.match(heading.strip()):
+        return SectionType.ARGUMENT
 
     return SectionType.OTHER
 
 
-def is_heading(paragraph: Paragraph) -> bool:
-    """Check if a paragraph is likely a heading based on formatting."""
-    if not paragraph.text.strip():
+def is_heading_fast(text: str, style_name: Optional[str], all_bold: bool) -> bool:
+    """
+    Check if a paragraph is likely a heading, given pre-extracted fields.
+
+    text is the paragraph's raw text, style_name the name of its
+    paragraph style, and all_bold whether it has runs and every run with
+    visible text is explicitly bold.
+    """
+    text = text.strip()
+    if not text:
         return False
 
     # Check for explicit heading styles
-    if paragraph.style and 'Heading' in paragraph.style.name:
+    if style_name and 'Heading' in style_name:
         return True
 
-    # Check for all caps (common in legal briefs)
-    text = paragraph.text.strip()
-    if text.isupper() and len(text) < 200:
-        return True
+    # All-caps and all-bold only count for short paragraphs; test the
+    # length first so long body paragraphs are never scanned
+    if len(text) < 200:
+        # Check for all caps (common in legal briefs)
+        if text.isupper():
+            return True
 
-    # Check for bold formatting
-    if paragraph.runs:
-        all_bold = all(run.bold for run in paragraph.runs if run.text.strip())
-        if all_bold and len(text) < 200:
+        # Check for bold formatting
+        if all_bold:
             return True
 
     # Check for roman numeral or letter patterns
-    for pattern in ARGUMENT_HEADING_PATTERNS:
-        if re.match(pattern, text):
-            return True
+    if ARGUMENT_HEADING_RE.match(text):
+        return True
 
     return False
 
 
-def identify_procedural_posture(text: str) -> Optional[ProceduralPosture]:
+def is_heading(paragraph: Paragraph) -> bool:
+    """Check if a paragraph is likely a heading based on formatting."""
+    style = paragraph.style
+    runs = paragraph.runs
+    all_bold = bool(runs) and all(run.bold for run in runs if run.text.strip())
+    return is_heading_fast(paragraph.text, style.name if style else None, all_bold)
+
+
+def _paragraph_style_names(doc: DocxDocument) -> tuple[dict[str, str], Optional[str]]:
+    """Map paragraph style IDs to style names, plus the default style's name."""
+    names = {}
+    for style in doc.styles:
+        if style.type == WD_STYLE_TYPE.PARAGRAPH:
+            names.setdefault(style.style_id, style.name)
+    default = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+    return names, default.name if default else None
+
+
+def _run_is_bold(r) -> Optional[bool]:
+    """Read a <w:r>'s direct bold setting the way Run.bold does."""
+    rPr = r.find(qn("w:rPr"))
+    b = rPr.find(qn("w:b")) if rPr is not None else None
+    if b is None:
+        return None
+    val = b.get(qn("w:val"))
+    return val is None or val in ("1", "true", "on")
+
+
+def _docx_paragraph_fields(p, style_names: dict[str, str], default_style: Optional[str]) -> tuple[str, Optional[str], bool]:
+    """
+    Extract (text, style_name, all_bold) from a <w:p> element.
+
+    Reads the XML directly instead of going through python-docx's
+    Paragraph/Run/Style objects, which re-walk the XML and resolve the
+    style part on every property access.
+    """
+    style_name = style_names.get(p.style, default_style) if p.style else default_style
+    text = p.text
+
+    # Boldness is only consulted for short paragraphs (see is_heading_fast).
+    # Check each run's bold flag before its text, so the text of bold runs
+    # is never built, and stop at the first non-bold run with visible text.
+    all_bold = False
+    if len(text.strip()) < 200:
+        runs = p.r_lst
+        all_bold = bool(runs) and all(
+            _run_is_bold(r) or not r.text.strip() for r in runs
+        )
+    return text, style_name, all_bold
+
+
+def _lower_preserving_offsets(text: str) -> str:
+    """
+    Lowercase text without changing its length, so that match offsets in the
+    result index the same characters in the original.
+    """
+    # U+0130 is the only character whose lowercase form is two code points
+    return text.replace("\u0130", "i").lower()
+
+
+def identify_procedural_posture(
+    text: str, text_lower: Optional[str] = None
+) -> Optional[ProceduralPosture]:
     """Identify the procedural posture from brief text."""
-    text_lower = text.lower()
-
-    patterns = [
-        (ProceduralPosture.MOTION_TO_DISMISS, [
-            r"motion\s+to\s+dismiss",
-            r"12\(b\)\(6\)",
-            r"failure\s+to\s+state\s+a\s+claim"
-        ]),
-        (ProceduralPosture.SUMMARY_JUDGMENT, [
-            r"motion\s+for\s+summary\s+judgment",
-            r"summary\s+judgment",
-            r"rule\s+56"
-        ]),
-        (ProceduralPosture.PRELIMINARY_INJUNCTION, [
-            r"preliminary\s+injunction",
-            r"temporary\s+restraining\s+order",
-            r"tro"
-        ]),
-        (ProceduralPosture.MOTION_TO_COMPEL, [
-            r"motion\s+to\s+compel"
-        ]),
-        (ProceduralPosture.OPPOSITION, [
-            r"opposition\s+to",
-            r"in\s+opposition"
-        ]),
-        (ProceduralPosture.REPLY, [
-            r"reply\s+in\s+support",
-            r"reply\s+brief",
-            r"reply\s+memorandum"
-        ]),
-        (ProceduralPosture.APPEAL_BRIEF, [
-            r"appellant[\'s]*\s+brief",
-            r"appellee[\'s]*\s+brief",
-            r"opening\s+brief",
-            r"answering\s+brief"
-        ]),
-    ]
-
-    for posture, posture_patterns in patterns:
-        for pattern in posture_patterns:
-            if re.search(pattern, text_lower):
-                return posture
+    if text_lower is None:
+        text_lower = text.lower()
+
+    # A single scan finds every posture mention; earlier entries in
+    # PROCEDURAL_PATTERNS take precedence regardless of where they appear
+    best = None
+    for match in PROCEDURAL_RE.finditer(text_lower):
+        priority = int(match.lastgroup[1:].split("_")[0])
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+
+    if best is not None:
+        return PROCEDURAL_PATTERNS[best][0]
 
     return ProceduralPosture.OTHER
 
 
-def extract_court_info(text: str) -> tuple[Optional[str], Optional[str]]:
-    """Extract court and jurisdiction from brief text."""
-    court = None
-    jurisdiction = None
+def extract_court_info(
+    text: str, text_lower: Optional[str] = None
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Extract court and jurisdiction from brief text.
 
-    # Federal district courts
-    district_pattern = r"((?:Northern|Southern|Eastern|Western|Central|Middle)\s+District\s+of\s+\w+)"
-    match = re.search(district_pattern, text, re.IGNORECASE)
+    A state court mention takes precedence over a circuit, which takes
+    precedence over a district court, so patterns are tried in that order
+    and the first hit is returned without scanning for the others.
+
+    text_lower, if given, must come from _lower_preserving_offsets(text);
+    matches are found there and the court is sliced from the original text.
+    """
+    if text_lower is None:
+        text_lower = _lower_preserving_offsets(text)
+
+    # State courts
+    match = COURT_STATE_RE.search(text_lower)
     if match:
-        court = match.group(1)
-        jurisdiction = "federal"
+        return text[match.start():match.end()], match.group(1)
 
     # Circuit courts
-    circuit_pattern = r"(\d+(?:st|nd|rd|th)\s+Circuit|(?:First|Second|Third|Fourth|Fifth|Sixth|Seventh|Eighth|Ninth|Tenth|Eleventh|D\.?C\.?)\s+Circuit)"
-    match = re.search(circuit_pattern, text, re.IGNORECASE)
+    match = COURT_CIRCUIT_RE.search(text_lower)
     if match:
-        court = match.group(1)
-        jurisdiction = "federal"
+        return text[match.start(1):match.end(1)], "federal"
 
-    # State courts
-    state_pattern = r"(?:Superior\s+Court|Supreme\s+Court|Court\s+of\s+Appeal)\s+of\s+(?:the\s+State\s+of\s+)?(\w+)"
-    match = re.search(state_pattern, text, re.IGNORECASE)
+    # Federal district courts
+    match = COURT_DISTRICT_RE.search(text_lower)
     if match:
-        court = match.group(0)
-        jurisdiction = match.group(1).lower()
+        return text[match.start(1):match.end(1)], "federal"
 
-    return court, jurisdiction
+    return None, None
 
 
-def extract_case_info(text: str) -> tuple[Optional[str], Optional[str]]:
-    """Extract case name and number from brief text."""
+def extract_case_info(
+    text: str, text_lower: Optional[str] = None
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Extract case name and number from brief text.
+
+    text_lower has the same meaning as in extract_court_info.
+    """
     case_name = None
     case_number = None
 
-    # Case number patterns
-    case_num_patterns = [
-        r"Case\s+No\.?\s*:?\s*([\w\-:]+)",
-        r"No\.?\s+([\d\-cv\w]+)",
-        r"Docket\s+No\.?\s*:?\s*([\w\-]+)",
-    ]
+    if text_lower is None:
+        text_lower = _lower_preserving_offsets(text)
 
-    for pattern in case_num_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in CASE_NUMBER_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
-            case_number = match.group(1)
+            case_number = text[match.start(1):match.end(1)]
             break
 
     # Case name - look for "v." pattern in caption area (first 2000 chars)
     caption_text = text[:2000]
 
-    # Words/phrases that indicate we've captured court info, not party names
-    court_indicators = [
-        'district', 'court', 'circuit', 'united states', 'state of',
-        'superior', 'supreme', 'appellate', 'northern', 'southern',
-        'eastern', 'western', 'central', 'middle'
-    ]
-
-    # Try multiple patterns for case name extraction
-    case_name_patterns = [
-        # Pattern with Plaintiff/Defendant labels (most reliable)
-        r"([A-Z][A-Z\s\.,\'\-]+?)\s*,\s*Plaintiffs?\s*,?\s*v\.?\s+([A-Z][A-Z\s\.,\'\-]+?)\s*,\s*Defendants?",
-        # Mixed case with explicit labels
-        r"([A-Z][a-zA-Z\s\.,\'\-]+?)\s*,\s*Plaintiffs?\s*,?\s*v\.?\s+([A-Z][a-zA-Z\s\.,\'\-]+?)\s*,\s*Defendants?",
-        # All caps: NAME v. NAME (but require comma or newline after defendant to avoid grabbing too much)
-        r"([A-Z][A-Z\s\.,\'\-]{2,50}?)\s+v\.\s+([A-Z][A-Z\s\.,\'\-]{2,50}?)(?:\s*,|\s*\n|$)",
-    ]
-
-    for pattern in case_name_patterns:
-        match = re.search(pattern, caption_text, re.MULTILINE | re.IGNORECASE)
+    for pattern in CASE_NAME_PATTERNS:
+        match = pattern.search(caption_text)
         if match:
             plaintiff = match.group(1).strip().rstrip(',').title()
             defendant = match.group(2).strip().rstrip(',').title()
@@ -290,7 +666,7 @@ def extract_case_info(text: str) -> tuple[Optional[str], Optional[str]]:
 
             # Skip if this looks like court info got captured
             plaintiff_lower = plaintiff.lower()
-            if any(indicator in plaintiff_lower for indicator in court_indicators):
+            if any(indicator in plaintiff_lower for indicator in COURT_INDICATORS):
                 continue
 
             # Truncate if too long (keep it readable)
@@ -322,36 +698,70 @@ def generate_brief_title(case_name: Optional[str], case_number: Optional[str], f
     return name if name else filename
 
 
+def _normalize_lines(text: str) -> str:
+    """Strip each line and drop blank ones."""
+    # map/filter keep the per-line loop in C rather than in a generator
+    return "\n".join(filter(None, map(str.strip, text.split("\n"))))
+
+
+def _split_on_headings(text: str, heading_re) -> list[tuple[Optional[str], Optional[str], str]]:
+    """
+    Split text into (group, heading, body) blocks at heading lines.
+
+    heading_re is a MULTILINE pattern anchored at line starts; group is
+    the name of the alternative that matched the heading line. The first
+    block holds any text before the first heading and has no heading.
+    Bodies are normalized with _normalize_lines and may be empty.
+    """
+    blocks = []
+    group = None
+    heading = None
+    body_start = 0
+
+    for match in heading_re.finditer(text):
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.end())
+        if line_end == -1:
+            line_end = len(text)
+
+        blocks.append((group, heading, _normalize_lines(text[body_start:line_start])))
+        group = match.lastgroup
+        heading = text[line_start:line_end].strip()
+        body_start = line_end
+
+    blocks.append((group, heading, _normalize_lines(text[body_start:])))
+    return blocks
+
+
 def parse_docx(file_path: Path) -> Brief:
     """Parse a DOCX file into a Brief with sections and chunks."""
     doc = Document(file_path)
-    brief_id = str(uuid.uuid4())
+    brief_id = _new_id()
 
-    # Collect all text for metadata extraction
-    full_text = "\n".join(p.text for p in doc.paragraphs)
+    style_names, default_style = _paragraph_style_names(doc)
 
-    # Extract metadata
-    court, jurisdiction = extract_court_info(full_text)
-    case_name, case_number = extract_case_info(full_text)
-    procedural_posture = identify_procedural_posture(full_text)
-
-    # Parse into sections
+    # A single streaming pass over the body's <w:p> elements collects the
+    # full text and splits it into sections
+    paragraph_texts = []
     sections = []
     current_section_type = SectionType.CAPTION
     current_section_text = []
     current_section_title = None
     section_order = 0
 
-    for para in doc.paragraphs:
-        text = para.text.strip()
+    for p in doc.element.body.iterchildren(qn("w:p")):
+        raw_text, style_name, all_bold = _docx_paragraph_fields(p, style_names, default_style)
+        paragraph_texts.append(raw_text)
+
+        text = raw_text.strip()
         if not text:
             continue
 
-        if is_heading(para):
+        if is_heading_fast(raw_text, style_name, all_bold):
             # Save previous section if exists
             if current_section_text:
                 section = BriefSection(
-                    id=str(uuid.uuid4()),
+                    id=_new_id(),
                     brief_id=brief_id,
                     section_type=current_section_type,
                     title=current_section_title,
@@ -371,7 +781,7 @@ def parse_docx(file_path: Path) -> Brief:
     # Don't forget the last section
     if current_section_text:
         section = BriefSection(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             brief_id=brief_id,
             section_type=current_section_type,
             title=current_section_title,
@@ -380,6 +790,15 @@ def parse_docx(file_path: Path) -> Brief:
         )
         sections.append(section)
 
+    # Collect all text for metadata extraction
+    full_text = "\n".join(paragraph_texts)
+
+    # Extract metadata
+    full_text_lower = _lower_preserving_offsets(full_text)
+    court, jurisdiction = extract_court_info(full_text, full_text_lower)
+    case_name, case_number = extract_case_info(full_text, full_text_lower)
+    procedural_posture = identify_procedural_posture(full_text, full_text_lower)
+
     # Generate a good display title
     title = generate_brief_title(case_name, case_number, file_path.name)
 
@@ -400,66 +819,102 @@ def parse_docx(file_path: Path) -> Brief:
     return brief
 
 
-def parse_pdf(file_path: Path) -> Brief:
-    """Parse a PDF file into a Brief with sections and chunks."""
-    brief_id = str(uuid.uuid4())
+def _extract_pdf_page_range(file_path: Path, start: int, stop: int) -> list[Optional[str]]:
+    """Extract the text of pages [start, stop). Runs in a worker process."""
+    with pdfplumber.open(file_path) as pdf:
+        return [pdf.pages[i].extract_text() for i in range(start, stop)]
+
+
+def _extract_pdf_page_texts(file_path: Path) -> list[str]:
+    """
+    Extract the non-empty text of every page of a PDF, in page order.
 
-    full_text = ""
+    pdfplumber's extraction is CPU-bound pure Python, so long documents
+    are split into contiguous page ranges extracted in parallel, in the
+    shared pool from _get_pdf_page_pool.
+    """
+    global _pdf_page_pool
     with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                full_text += page_text + "\n"
+        page_count = len(pdf.pages)
+        workers = min(os.cpu_count() or 1, page_count // PDF_PAGES_PER_WORKER)
+        if workers <= 1 or not _parallel_pdf_pages:
+            page_texts = [page.extract_text() for page in pdf.pages]
+            return [text for text in page_texts if text]
+
+    step = -(-page_count // workers)  # ceiling division
+    starts = list(range(0, page_count, step))
+    stops = [min(start + step, page_count) for start in starts]
+
+    pool = _get_pdf_page_pool()
+    try:
+        ranges = list(pool.map(
+            _extract_pdf_page_range, [file_path] * len(starts), starts, stops
+        ))
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool for the next document
+        with _pdf_page_pool_lock:
+            if _pdf_page_pool is pool:
+                _pdf_page_pool = None
+        raise
+    return [text for page_texts in ranges for text in page_texts if text]
+
+
+def _get_pdf_page_pool() -> ProcessPoolExecutor:
+    """
+    The process pool for PDF page ranges, started if need be.
 
-    # Extract metadata
-    court, jurisdiction = extract_court_info(full_text)
-    case_name, case_number = extract_case_info(full_text)
-    procedural_posture = identify_procedural_posture(full_text)
+    Its workers are started by a forkserver: this runs in the API
+    server's worker threads, and forking a multi-threaded process can
+    leave a lock held forever in the child.
+    """
+    global _pdf_page_pool
+    with _pdf_page_pool_lock:
+        if _pdf_page_pool is None:
+            _pdf_page_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+        return _pdf_page_pool
 
-    # For PDFs, we do simpler section detection based on patterns
-    sections = []
-    lines = full_text.split("\n")
-    current_section_type = SectionType.CAPTION
-    current_section_text = []
-    current_section_title = None
-    section_order = 0
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
+def shutdown_pdf_page_pool() -> None:
+    """Stop the PDF page extraction worker processes, if started."""
+    global _pdf_page_pool
+    with _pdf_page_pool_lock:
+        pool, _pdf_page_pool = _pdf_page_pool, None
+    if pool is not None:
+        pool.shutdown()
 
-        # Check if this line is a section heading
-        detected_type = identify_section_type(line)
-        if detected_type != SectionType.OTHER:
-            # Save previous section
-            if current_section_text:
-                section = BriefSection(
-                    id=str(uuid.uuid4()),
-                    brief_id=brief_id,
-                    section_type=current_section_type,
-                    title=current_section_title,
-                    content="\n".join(current_section_text),
-                    order=section_order
-                )
-                sections.append(section)
-                section_order += 1
 
-            current_section_type = detected_type
-            current_section_title = line
-            current_section_text = []
-        else:
-            current_section_text.append(line)
+def parse_pdf(file_path: Path) -> Brief:
+    """Parse a PDF file into a Brief with sections and chunks."""
+    brief_id = _new_id()
 
-    # Last section
-    if current_section_text:
+    # Collect page texts and join once; += on a str copies the whole
+    # accumulated text for every page
+    page_texts = _extract_pdf_page_texts(file_path)
+    full_text = "".join(f"{page_text}\n" for page_text in page_texts)
+
+    # Extract metadata
+    full_text_lower = _lower_preserving_offsets(full_text)
+    court, jurisdiction = extract_court_info(full_text, full_text_lower)
+    case_name, case_number = extract_case_info(full_text, full_text_lower)
+    procedural_posture = identify_procedural_posture(full_text, full_text_lower)
+
+    # For PDFs, we do simpler section detection based on patterns:
+    # one scan finds every heading line, then the text between
+    # consecutive headings becomes a section
+    sections = []
+    for group, heading, body in _split_on_headings(full_text, PDF_HEADING_RE):
+        if not body:
+            continue
         section = BriefSection(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             brief_id=brief_id,
-            section_type=current_section_type,
-            title=current_section_title,
-            content="\n".join(current_section_text),
-            order=section_order
+            section_type=PDF_HEADING_GROUPS[group] if group else SectionType.CAPTION,
+            title=heading,
+            content=body,
+            order=len(sections)
         )
         sections.append(section)
 
@@ -494,7 +949,6 @@ def chunk_brief(brief: Brief) -> tuple[list[ArgumentChunk], list[Citation]]:
     - Legal standards are tagged for high reusability
     """
     chunks = []
-    citations = []
 
     for section in brief.sections:
         if section.section_type == SectionType.CAPTION:
@@ -509,7 +963,7 @@ def chunk_brief(brief: Brief) -> tuple[list[ArgumentChunk], list[Citation]]:
         else:
             # Other sections become single chunks
             chunk = ArgumentChunk(
-                id=str(uuid.uuid4()),
+                id=_new_id(),
                 brief_id=brief.id,
                 section_type=section.section_type,
                 heading=section.title,
@@ -522,11 +976,8 @@ def chunk_brief(brief: Brief) -> tuple[list[ArgumentChunk], list[Citation]]:
             )
             chunks.append(chunk)
 
-        # Extract citations from all chunks
-        for chunk in chunks:
-            chunk_citations = extract_citations(chunk.content, chunk.id)
-            chunk.citations = [c.id for c in chunk_citations]
-            citations.extend(chunk_citations)
+    # Extract citations from all chunks
+    citations = extract_chunk_citations(chunks)
 
     return chunks, citations
 
@@ -537,60 +988,19 @@ def _chunk_argument_section(
 ) -> list[ArgumentChunk]:
     """Break an argument section into sub-chunks by heading."""
     chunks = []
-    content = section.content
-    lines = content.split("\n")
-
-    current_heading = section.title
-    current_text = []
     parent_chunk_id = None
 
-    # Patterns for sub-headings within arguments
-    subheading_patterns = [
-        re.compile(r"^[A-Z]\.\s+.+"),  # A. , B. , etc.
-        re.compile(r"^\d+\.\s+.+"),     # 1. , 2. , etc.
-        re.compile(r"^[ivx]+\.\s+.+", re.IGNORECASE),  # roman numerals
-    ]
-
-    for line in lines:
-        line_stripped = line.strip()
-        if not line_stripped:
+    blocks = _split_on_headings(section.content, ARGUMENT_SUBHEADING_RE)
+    for _, heading, body in blocks:
+        if not body:
             continue
 
-        is_subheading = any(p.match(line_stripped) for p in subheading_patterns)
-
-        if is_subheading:
-            # Save previous chunk
-            if current_text:
-                chunk = ArgumentChunk(
-                    id=str(uuid.uuid4()),
-                    brief_id=brief.id,
-                    section_type=SectionType.ARGUMENT,
-                    heading=current_heading,
-                    content="\n".join(current_text),
-                    parent_chunk_id=parent_chunk_id,
-                    jurisdiction=brief.jurisdiction,
-                    court=brief.court,
-                    procedural_posture=brief.procedural_posture,
-                )
-                chunks.append(chunk)
-
-                # First chunk becomes parent for subsequent chunks
-                if parent_chunk_id is None:
-                    parent_chunk_id = chunk.id
-
-            current_heading = line_stripped
-            current_text = []
-        else:
-            current_text.append(line_stripped)
-
-    # Don't forget the last chunk
-    if current_text:
         chunk = ArgumentChunk(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             brief_id=brief.id,
             section_type=SectionType.ARGUMENT,
-            heading=current_heading,
-            content="\n".join(current_text),
+            heading=heading or section.title,
+            content=body,
             parent_chunk_id=parent_chunk_id,
             jurisdiction=brief.jurisdiction,
             court=brief.court,
@@ -598,6 +1008,10 @@ def _chunk_argument_section(
         )
         chunks.append(chunk)
 
+        # First chunk becomes parent for subsequent chunks
+        if parent_chunk_id is None:
+            parent_chunk_id = chunk.id
+
     return chunks
 
 
@@ -611,3 +1025,49 @@ def parse_document(file_path: Path) -> Brief:
         return parse_pdf(file_path)
     else:
         raise ValueError(f"Unsupported file type: {suffix}")
+
+
+def _init_parse_worker() -> None:
+    """Set up a parse worker process."""
+    global _parallel_pdf_pages
+    _parallel_pdf_pages = False
+
+
+def create_parse_pool(max_workers: Optional[int] = None, mp_context=None) -> ProcessPoolExecutor:
+    """
+    A process pool for parsing documents, with its workers set up to
+    parse one document each, without splitting PDFs across processes of
+    their own.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=mp_context, initializer=_init_parse_worker
+    )
+
+
+def parse_and_chunk_document(file_path: Path) -> tuple[Brief, list[ArgumentChunk], list[Citation]]:
+    """
+    Parse a document and chunk the brief, as parse_document then
+    chunk_brief. A single call, so a worker process can do both.
+    """
+    brief = parse_document(file_path)
+    chunks, citations = chunk_brief(brief)
+    return brief, chunks, citations
+
+
+def parse_documents(file_paths: list[Path], max_workers: Optional[int] = None) -> list[Brief]:
+    """
+    Parse several documents, in parallel processes when there is more than one.
+
+    Briefs are returned in the order of file_paths. Each worker imports
+    this module (and compiles its patterns) once and reuses it for every
+    document it is given. Raises ValueError for an unsupported file type,
+    like parse_document.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+    if workers <= 1:
+        return [parse_document(file_path) for file_path in file_paths]
+
+    # forkserver, so workers are not forked from a caller that may be
+    # multi-threaded (a lock held by another thread would stay held in them)
+    with create_parse_pool(workers, multiprocessing.get_context("forkserver")) as executor:
+        return list(executor.map(parse_document, file_paths))
@@ -5,14 +5,31 @@ Uses Anthropic's API for generating embeddings and stores them
 in a simple JSON format for the MVP.
 """
 
+import asyncio
+import hashlib
 import json
 import os
+import random
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, NamedTuple, Optional
 import numpy as np
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 
-from .models import ArgumentChunk, BriefStore
+# Dense embeddings are optional: with the voyageai package installed and
+# VOYAGE_API_KEY set, chunks are embedded when added and searched by cosine
+# similarity. Otherwise search falls back to word-overlap scoring.
+try:
+    import voyageai
+except ImportError:
+    voyageai = None
+
+from .models import ArgumentChunk, Brief, BriefStore, Citation
 
 
 # We'll use a simple approach: generate embeddings using Claude
@@ -20,15 +37,60 @@ from .models import ArgumentChunk, BriefStore
 # For production, you'd want to use a dedicated embedding model.
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
-STORE_FILE = DATA_DIR / "embeddings" / "brief_store.json"
+STORE_FILE = DATA_DIR / "embeddings" / "brief_store.ndjson"
+
+# Dense embedding model and the number of texts sent per embedding call
+EMBEDDING_MODEL = "voyage-law-2"
+EMBEDDING_BATCH_SIZE = 128
+
+# Searches remembered per store, least recently used evicted first. With
+# dense embeddings, a cached search is also reused for a query whose
+# embedding is at least this similar to the cached query's (a paraphrase).
+SEARCH_CACHE_SIZE = 256
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
 
+@lru_cache(maxsize=1)
+def get_anthropic_client() -> AsyncAnthropic:
+    """
+    Get the async Anthropic client, created from the environment on first use.
 
-def get_anthropic_client() -> Anthropic:
-    """Get Anthropic client from environment."""
+    The client is shared by every caller, so concurrent requests reuse its
+    connection pool rather than each opening (and TLS-handshaking) its own.
+    """
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-    return Anthropic(api_key=api_key)
+    return AsyncAnthropic(api_key=api_key)
+
+
+def get_embedding_client():
+    """Get a Voyage AI client from environment, or None if dense embeddings aren't set up."""
+    api_key = os.environ.get("VOYAGE_API_KEY")
+    if voyageai is None or not api_key:
+        return None
+    return voyageai.Client(api_key=api_key)
+
+
+def embed_texts(texts: list[str], client, input_type: str) -> np.ndarray:
+    """
+    Embed texts with the dense embedding model, EMBEDDING_BATCH_SIZE per call.
+
+    input_type is "document" for stored chunks and "query" for searches.
+    Rows are L2-normalized float32, so cosine similarity is a dot product.
+    """
+    vectors = []
+    for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+        result = client.embed(
+            texts[start:start + EMBEDDING_BATCH_SIZE],
+            model=EMBEDDING_MODEL,
+            input_type=input_type,
+        )
+        vectors.extend(result.embeddings)
+
+    matrix = np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
 
 
 def generate_embedding_text(chunk: ArgumentChunk) -> str:
@@ -72,159 +134,602 @@ def generate_embedding_text(chunk: ArgumentChunk) -> str:
     return "\n".join(parts)
 
 
-async def generate_semantic_keywords(chunk: ArgumentChunk, client: Anthropic) -> list[str]:
-    """
-    Use Claude to extract semantic keywords/concepts from a chunk.
+# Number of chunks whose keywords are requested in a single API call
+KEYWORD_BATCH_SIZE = 16
 
-    This helps with retrieval by identifying the legal concepts
-    even when exact phrases don't match.
-    """
-    prompt = f"""Analyze this legal brief excerpt and extract key legal concepts, issues, and doctrines.
+# Maximum number of keyword requests in flight at once
+KEYWORD_MAX_CONCURRENT_REQUESTS = 5
 
-Excerpt:
-{chunk.content[:1500]}
+# Instructions shared by every keyword request. They are sent as a cached
+# system block so repeated calls don't pay for them as fresh input tokens;
+# only the excerpts change from call to call.
+KEYWORD_INSTRUCTIONS = """Analyze each legal brief excerpt you are given and extract its key legal concepts, issues, and doctrines.
 
-Return a JSON array of 5-10 key legal concepts/issues. Be specific about legal doctrines.
+For each excerpt, identify 5-10 key legal concepts/issues. Be specific about legal doctrines.
 Examples: "personal jurisdiction", "12(b)(6) motion to dismiss", "statute of limitations",
 "breach of fiduciary duty", "minimum contacts test", "purposeful availment"
 
-Return ONLY the JSON array, no other text."""
+Return ONLY a JSON object mapping each excerpt number to its JSON array of concepts,
+e.g. {"0": ["...", "..."], "1": ["...", "..."]}, no other text."""
+
+
+async def _request_keyword_batch(chunks: list[ArgumentChunk], client: AsyncAnthropic) -> dict[int, list[str]]:
+    """
+    Ask Claude for the keywords of several chunks in one call.
+
+    Returns keyword lists keyed by the chunk's index in chunks; chunks the
+    response left out (or that could not be parsed) are missing.
+    """
+    excerpts = "\n\n".join(
+        f"Excerpt {i}:\n{chunk.content[:1500]}" for i, chunk in enumerate(chunks)
+    )
 
-    response = client.messages.create(
+    response = await client.messages.create(
         model="claude-sonnet-4-20250514",
-        max_tokens=500,
-        messages=[{"role": "user", "content": prompt}]
+        max_tokens=500 * len(chunks),
+        system=[{
+            "type": "text",
+            "text": KEYWORD_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"},
+        }],
+        messages=[{"role": "user", "content": excerpts}]
     )
 
     try:
-        keywords = json.loads(response.content[0].text)
-        return keywords if isinstance(keywords, list) else []
+        data = json.loads(response.content[0].text)
     except json.JSONDecodeError:
-        return []
-
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    results = {}
+    for i in range(len(chunks)):
+        keywords = data.get(str(i))
+        if isinstance(keywords, list):
+            results[i] = keywords
+    return results
+
+
+async def generate_semantic_keywords_batch(
+    chunks: list[ArgumentChunk],
+    client: AsyncAnthropic,
+    batch_size: int = KEYWORD_BATCH_SIZE
+) -> list[list[str]]:
+    """
+    Use Claude to extract semantic keywords/concepts from many chunks.
 
-def compute_similarity(query_text: str, chunk_text: str) -> float:
+    Chunks are sent batch_size at a time, so N chunks take about
+    N / batch_size round-trips instead of N, and up to
+    KEYWORD_MAX_CONCURRENT_REQUESTS of those run concurrently. Any chunk
+    missing from a batch's response is retried on its own. Returns one
+    keyword list per chunk, in input order.
     """
-    Compute text similarity using keyword overlap and fuzzy matching.
+    semaphore = asyncio.Semaphore(KEYWORD_MAX_CONCURRENT_REQUESTS)
+
+    async def request(batch: list[ArgumentChunk]) -> dict[int, list[str]]:
+        async with semaphore:
+            # Jitter so requests released together don't all hit the
+            # API in the same instant and trip its rate limit
+            await asyncio.sleep(random.random() * 0.05)
+            return await _request_keyword_batch(batch, client)
+
+    async def run_batch(batch: list[ArgumentChunk]) -> list[list[str]]:
+        found = await request(batch)
+        missing = [i for i in range(len(batch)) if i not in found]
+        if missing and len(batch) > 1:
+            retried = await asyncio.gather(*(request([batch[i]]) for i in missing))
+            for i, result in zip(missing, retried):
+                if 0 in result:
+                    found[i] = result[0]
+        return [found.get(i, []) for i in range(len(batch))]
+
+    batch_keywords = await asyncio.gather(*(
+        run_batch(chunks[start:start + batch_size])
+        for start in range(0, len(chunks), batch_size)
+    ))
+    return [keywords for batch in batch_keywords for keywords in batch]
+
+
+async def generate_semantic_keywords(chunk: ArgumentChunk, client: AsyncAnthropic) -> list[str]:
+    """
+    Use Claude to extract semantic keywords/concepts from a chunk.
 
-    For MVP, we use a simple approach:
-    - Normalize both texts
-    - Compute Jaccard similarity on word sets
-    - Boost for exact phrase matches
+    This helps with retrieval by identifying the legal concepts
+    even when exact phrases don't match.
+    """
+    return (await generate_semantic_keywords_batch([chunk], client))[0]
+
+
+# Common words ignored when comparing texts
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
+    'as', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'between', 'under', 'again', 'further', 'then', 'once',
+    'that', 'this', 'these', 'those', 'and', 'but', 'or', 'nor',
+    'so', 'yet', 'both', 'each', 'few', 'more', 'most', 'other',
+    'some', 'such', 'no', 'not', 'only', 'own', 'same', 'than',
+})
+
+# Key legal terms; each one shared by query and chunk boosts the score
+LEGAL_TERMS = frozenset({
+    'jurisdiction', 'motion', 'dismiss', 'summary', 'judgment',
+    'contract', 'breach', 'negligence', 'fraud', 'tort',
+    'statute', 'limitations', 'standing', 'preemption',
+    'discovery', 'evidence', 'damages', 'injunction', 'relief'
+})
+
+
+def tokenize(text: str) -> frozenset[str]:
+    """
+    Normalize text into the set of words compared by similarity scoring.
 
-    For production, use proper embeddings.
+    Words are interned: every chunk's token set and the search indexes
+    share one string per distinct word, and lookups of query words in
+    the indexes compare by identity.
     """
-    # Normalize
-    query_words = set(query_text.lower().split())
-    chunk_words = set(chunk_text.lower().split())
-
-    # Remove common words
-    stop_words = {
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-        'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-        'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-        'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
-        'as', 'into', 'through', 'during', 'before', 'after', 'above',
-        'below', 'between', 'under', 'again', 'further', 'then', 'once',
-        'that', 'this', 'these', 'those', 'and', 'but', 'or', 'nor',
-        'so', 'yet', 'both', 'each', 'few', 'more', 'most', 'other',
-        'some', 'such', 'no', 'not', 'only', 'own', 'same', 'than',
-    }
-
-    query_words = query_words - stop_words
-    chunk_words = chunk_words - stop_words
+    return frozenset(map(sys.intern, text.lower().split())) - STOP_WORDS
+
 
+def score_tokens(query_words: frozenset[str], chunk_words: frozenset[str]) -> float:
+    """Similarity score of two word sets produced by tokenize()."""
     if not query_words or not chunk_words:
         return 0.0
 
     # Jaccard similarity
-    intersection = len(query_words & chunk_words)
-    union = len(query_words | chunk_words)
+    shared = query_words & chunk_words
+    intersection = len(shared)
+    union = len(query_words) + len(chunk_words) - intersection
     jaccard = intersection / union if union > 0 else 0
 
     # Boost for key legal terms matching
-    legal_terms = {
-        'jurisdiction', 'motion', 'dismiss', 'summary', 'judgment',
-        'contract', 'breach', 'negligence', 'fraud', 'tort',
-        'statute', 'limitations', 'standing', 'preemption',
-        'discovery', 'evidence', 'damages', 'injunction', 'relief'
-    }
-
-    legal_matches = len((query_words & chunk_words) & legal_terms)
+    legal_matches = len(shared & LEGAL_TERMS)
     legal_boost = legal_matches * 0.1
 
     return min(1.0, jaccard + legal_boost)
 
 
+def compute_similarity(query_text: str, chunk_text: str) -> float:
+    """
+    Compute text similarity using keyword overlap and fuzzy matching.
+
+    For MVP, we use a simple approach:
+    - Normalize both texts
+    - Compute Jaccard similarity on word sets
+    - Boost for exact phrase matches
+
+    For production, use proper embeddings. When one side is compared
+    repeatedly, tokenize it once and call score_tokens instead.
+    """
+    return score_tokens(tokenize(query_text), tokenize(chunk_text))
+
+
+class _StoreRecord(BaseModel):
+    """One line of the store log: a brief being added, or a tombstone."""
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+    brief: Optional[Brief] = None
+    chunks: list[ArgumentChunk] = []
+    citations: list[Citation] = []
+    # The chunks' dense embeddings, one float32 row per chunk, if any
+    embeddings: Optional[bytes] = None
+    delete: Optional[str] = None
+
+
+# Serializes and parses log lines as bytes directly; model_dump_json would
+# return a str that still has to be encoded
+_STORE_RECORD = TypeAdapter(_StoreRecord)
+
+
+class _SearchMatrix(NamedTuple):
+    """
+    The search indexes as arrays. Row i describes the chunk chunk_ids[i];
+    rows are in insertion order.
+    """
+    chunk_ids: list[str]
+    # Number of distinct tokens in each row's chunk
+    token_counts: np.ndarray
+    # For every token, the rows whose chunk contains it: in effect the
+    # columns of a sparse chunk-by-token matrix
+    posting_rows: dict[str, np.ndarray]
+    # Each row's jurisdiction and procedural posture value (None if unset)
+    jurisdictions: np.ndarray
+    postures: np.ndarray
+    # Each row's dense embedding, or None unless every chunk has one
+    vectors: Optional[np.ndarray]
+
+
 class BriefBankStore:
     """
     Persistent storage for the brief bank.
 
-    Stores briefs, chunks, and citations in JSON format.
+    Stores briefs, chunks, and citations as an append-only log of JSON
+    records, one per line: add_brief appends the brief together with its
+    chunks and citations, delete_brief appends a tombstone, so neither
+    rewrites the whole store.
     """
 
-    def __init__(self, store_path: Optional[Path] = None):
+    def __init__(self, store_path: Optional[Path] = None, embedding_client=None):
         self.store_path = store_path or STORE_FILE
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self.embedding_client = embedding_client or get_embedding_client()
+
+        # Guards the store, its indexes and search cache, and the store
+        # file, so searches can run in worker threads (asyncio.to_thread)
+        # while the event loop adds or deletes briefs
+        self._lock = threading.RLock()
+
+        # Records held back by batch() until its outermost block exits
+        self._batch_depth = 0
+        self._pending_records: list[bytes] = []
+
         self._load()
 
     def _load(self):
-        """Load store from disk."""
+        """
+        Load store from disk by replaying its log.
+
+        The log is compacted afterwards if it held tombstones or a record
+        cut short by a crash. Only an unterminated last line counts as
+        cut short: any other line that is not a valid record raises
+        ValueError, leaving the file as it is. A whole-store JSON file
+        written by earlier versions (same name, .json suffix) is migrated.
+        """
+        self.store = BriefStore()
+
+        # Search indexes, kept in memory only: the tokenized embedding text
+        # of every chunk (so searches only tokenize the query) and each
+        # chunk's insertion rank (so results keep store order among equal
+        # scores). The inverted index is built from the token sets by
+        # _search_matrix, not maintained per chunk, so loading stays cheap.
+        self._chunk_tokens: dict[str, frozenset[str]] = {}
+        self._chunk_rank: dict[str, int] = {}
+        self._next_rank = 0
+        self._matrix = None
+        # Dense embedding of each chunk that has one
+        self._chunk_vectors: dict[str, np.ndarray] = {}
+        # Dense embeddings by SHA-256 of their embedding text, so add_brief
+        # embeds text only once. Built from the stored chunks on first use;
+        # entries outlive deleted chunks, so a brief can be re-uploaded free.
+        self._vectors_by_text: Optional[dict[bytes, np.ndarray]] = None
+        # Recent searches: (query, jurisdiction, procedural_posture, limit)
+        # -> (query embedding or None, results). Only valid for the current
+        # search matrix, so cleared whenever it is rebuilt.
+        self._search_cache: OrderedDict[tuple, tuple] = OrderedDict()
+
+        legacy_path = self.store_path.with_suffix(".json")
         if self.store_path.exists():
-            with open(self.store_path, 'r') as f:
-                data = json.load(f)
-                self.store = BriefStore(**data)
-        else:
-            self.store = BriefStore()
+            compact = False
+            with open(self.store_path, 'rb') as f:
+                for line_number, line in enumerate(f, 1):
+                    # Only the last line can lack its newline. Compacting
+                    # rewrites it, so the next append starts a fresh line.
+                    complete = line.endswith(b"\n")
+                    if not complete:
+                        compact = True
+                    try:
+                        record = _STORE_RECORD.validate_json(line)
+                    except ValidationError as e:
+                        if complete:
+                            raise ValueError(
+                                f"{self.store_path}: line {line_number} is not a valid store record"
+                            ) from e
+                        # A write cut short by a crash; drop it
+                        continue
+
+                    if record.delete is not None:
+                        self._remove_brief(record.delete)
+                        compact = True
+                    elif record.brief is not None:
+                        vectors = None
+                        if record.embeddings is not None:
+                            vectors = np.frombuffer(record.embeddings, dtype=np.float32)
+                            vectors = vectors.reshape(len(record.chunks), -1)
+                        self._insert_brief(record.brief, record.chunks, record.citations, vectors)
+            if compact:
+                self._save()
+        elif legacy_path.exists():
+            with open(legacy_path, 'rb') as f:
+                self.store = BriefStore.model_validate_json(f.read())
+            for chunk in self.store.chunks.values():
+                self._index_chunk(chunk)
+            self._save()
+
+    def _index_chunk(self, chunk: ArgumentChunk):
+        """Add a chunk to the search indexes, replacing any older entry."""
+        self._unindex_tokens(chunk.id)
+        self._matrix = None
+        self._chunk_tokens[chunk.id] = tokenize(generate_embedding_text(chunk))
+
+        # A replaced chunk keeps its place in self.store.chunks, so it
+        # keeps its rank too
+        if chunk.id not in self._chunk_rank:
+            self._chunk_rank[chunk.id] = self._next_rank
+            self._next_rank += 1
+
+    def _unindex_tokens(self, chunk_id: str):
+        """Remove a chunk's tokens from the search indexes."""
+        self._matrix = None
+        self._chunk_tokens.pop(chunk_id, None)
+
+    def _search_matrix(self) -> "_SearchMatrix":
+        """Array form of the search indexes, rebuilt lazily after the store changes."""
+        if self._matrix is None:
+            self._search_cache.clear()
+            chunk_ids = sorted(self._chunk_tokens, key=self._chunk_rank.__getitem__)
+            chunks = [self.store.chunks[chunk_id] for chunk_id in chunk_ids]
+            vectors = None
+            if chunk_ids and all(chunk_id in self._chunk_vectors for chunk_id in chunk_ids):
+                vectors = np.stack([self._chunk_vectors[chunk_id] for chunk_id in chunk_ids])
+            # Inverted index: the rows whose chunk contains each token
+            token_rows: dict[str, list[int]] = {}
+            for row, chunk_id in enumerate(chunk_ids):
+                for token in self._chunk_tokens[chunk_id]:
+                    token_rows.setdefault(token, []).append(row)
+            self._matrix = _SearchMatrix(
+                chunk_ids=chunk_ids,
+                token_counts=np.fromiter(
+                    (len(self._chunk_tokens[chunk_id]) for chunk_id in chunk_ids),
+                    dtype=np.int64, count=len(chunk_ids)
+                ),
+                posting_rows={
+                    token: np.array(rows, dtype=np.intp) for token, rows in token_rows.items()
+                },
+                jurisdictions=np.array([chunk.jurisdiction for chunk in chunks], dtype=object),
+                postures=np.array([
+                    chunk.procedural_posture.value if chunk.procedural_posture else None
+                    for chunk in chunks
+                ], dtype=object),
+                vectors=vectors,
+            )
+        return self._matrix
+
+    @staticmethod
+    def _add_record(
+        brief: Brief,
+        chunks: list[ArgumentChunk],
+        citations: list[Citation],
+        vectors: Optional[np.ndarray] = None
+    ) -> bytes:
+        """
+        Serialize the log record that adds a brief.
+
+        Uses pydantic's own JSON serializer, which writes straight from the
+        models without building intermediate dicts.
+        """
+        record = _StoreRecord.model_construct(
+            brief=brief, chunks=chunks, citations=citations,
+            embeddings=vectors.astype(np.float32).tobytes() if vectors is not None else None
+        )
+        return _STORE_RECORD.dump_json(record, exclude={"delete"}) + b"\n"
+
+    def _append(self, record: bytes):
+        """
+        Append a serialized record to the store file (deferred inside batch()).
+
+        If the write fails part way (a full disk, say), the file is
+        truncated back to its old length and the error re-raised, so a
+        torn record never has the next one appended onto its line.
+        """
+        if self._batch_depth:
+            self._pending_records.append(record)
+            return
+        # Unbuffered, so a failed write surfaces here rather than on close
+        with open(self.store_path, 'ab', buffering=0) as f:
+            offset = f.seek(0, os.SEEK_END)
+            try:
+                view = memoryview(record)
+                while view:
+                    view = view[f.write(view):]
+            except BaseException:
+                f.truncate(offset)
+                raise
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several add_brief/delete_brief calls into one write.
+
+        Their records are buffered and appended together when the
+        outermost batch exits, even if it exits with an exception, so the
+        file always matches the in-memory store. If that append fails, the
+        store is reloaded from the file, undoing the batch in memory too.
+
+        Holds the store lock throughout, so calls from other threads wait
+        for the batch instead of joining it.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._pending_records:
+                    records, self._pending_records = self._pending_records, []
+                    try:
+                        self._append(b"".join(records))
+                    except BaseException:
+                        self._load()
+                        raise
 
     def _save(self):
-        """Save store to disk."""
-        with open(self.store_path, 'w') as f:
-            json.dump(self.store.model_dump(), f, indent=2, default=str)
+        """
+        Rewrite the store file with one add record per stored brief.
+
+        The new file is written alongside and renamed over the old one, so
+        a crash mid-write leaves the previous file intact.
+        """
+        brief_by_chunk = {
+            chunk_id: brief_id
+            for brief_id, chunk_ids in self.store.chunks_by_brief.items()
+            for chunk_id in chunk_ids
+        }
+        citations_by_brief = {}
+        for citation in self.store.citations.values():
+            brief_id = brief_by_chunk.get(citation.parent_chunk_id)
+            citations_by_brief.setdefault(brief_id, []).append(citation)
+
+        tmp_path = self.store_path.with_name(self.store_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            for brief_id, brief in self.store.briefs.items():
+                chunks = [
+                    self.store.chunks[chunk_id]
+                    for chunk_id in self.store.chunks_by_brief.get(brief_id, [])
+                ]
+                vectors = None
+                if chunks and all(chunk.id in self._chunk_vectors for chunk in chunks):
+                    vectors = np.stack([self._chunk_vectors[chunk.id] for chunk in chunks])
+                f.write(self._add_record(brief, chunks, citations_by_brief.get(brief_id, []), vectors))
+        os.replace(tmp_path, self.store_path)
 
     def add_brief(self, brief, chunks, citations):
-        """Add a brief and its chunks to the store."""
-        from .models import Brief, ArgumentChunk, Citation
+        """
+        Add a brief and its chunks to the store.
 
+        With an embedding client, the chunks are embedded here (see
+        _embed_chunks).
+        """
+        vectors = None
+        if self.embedding_client is not None and chunks:
+            vectors = self._embed_chunks(chunks)
+        record = self._add_record(brief, chunks, citations, vectors)
+        with self._lock:
+            self._append(record)
+            self._insert_brief(brief, chunks, citations, vectors)
+
+    def add_briefs(self, items: list[tuple[Brief, list[ArgumentChunk], list[Citation]]]):
+        """
+        Add several (brief, chunks, citations) to the store, as add_brief.
+
+        The chunks of all the briefs are embedded together, and their
+        records are written to the store file in one append.
+        """
+        all_chunks = [chunk for _, chunks, _ in items for chunk in chunks]
+        vectors = None
+        if self.embedding_client is not None and all_chunks:
+            vectors = self._embed_chunks(all_chunks)
+
+        split = []
+        start = 0
+        for brief, chunks, citations in items:
+            brief_vectors = None
+            if vectors is not None and chunks:
+                brief_vectors = vectors[start:start + len(chunks)]
+            start += len(chunks)
+            split.append((brief, chunks, citations, brief_vectors))
+        records = b"".join(self._add_record(*item) for item in split)
+
+        with self._lock:
+            self._append(records)
+            for item in split:
+                self._insert_brief(*item)
+
+    def _embed_chunks(self, chunks: list[ArgumentChunk]) -> np.ndarray:
+        """
+        Dense embeddings of chunks, one row each.
+
+        Text embedded before (a re-uploaded brief, boilerplate shared
+        between briefs) reuses its vector. The rest is embedded in
+        batches, each distinct text once.
+        """
+        texts = [generate_embedding_text(chunk) for chunk in chunks]
+        keys = [hashlib.sha256(text.encode()).digest() for text in texts]
+
+        with self._lock:
+            if self._vectors_by_text is None:
+                self._vectors_by_text = {
+                    hashlib.sha256(generate_embedding_text(self.store.chunks[chunk_id]).encode()).digest(): vector
+                    for chunk_id, vector in self._chunk_vectors.items()
+                }
+            known = {key: self._vectors_by_text[key] for key in keys if key in self._vectors_by_text}
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in known}
+        if missing:
+            new_vectors = embed_texts(list(missing.values()), self.embedding_client, "document")
+            known.update(zip(missing, new_vectors))
+            with self._lock:
+                self._vectors_by_text.update(zip(missing, new_vectors))
+
+        return np.stack([known[key] for key in keys])
+
+    def _insert_brief(self, brief, chunks, citations, vectors: Optional[np.ndarray] = None):
+        """
+        Add a brief and its chunks to the in-memory store and indexes.
+
+        vectors, if given, holds the chunks' dense embeddings, one row each.
+        """
         self.store.briefs[brief.id] = brief
         self.store.chunks_by_brief[brief.id] = []
 
-        for chunk in chunks:
+        for i, chunk in enumerate(chunks):
             self.store.chunks[chunk.id] = chunk
             self.store.chunks_by_brief[brief.id].append(chunk.id)
+            self._index_chunk(chunk)
+            if vectors is not None:
+                self._chunk_vectors[chunk.id] = vectors[i]
+            else:
+                self._chunk_vectors.pop(chunk.id, None)
 
             # Index by jurisdiction
             if chunk.jurisdiction:
-                if chunk.jurisdiction not in self.store.chunks_by_jurisdiction:
-                    self.store.chunks_by_jurisdiction[chunk.jurisdiction] = []
-                self.store.chunks_by_jurisdiction[chunk.jurisdiction].append(chunk.id)
+                self.store.chunks_by_jurisdiction.setdefault(chunk.jurisdiction, set()).add(chunk.id)
 
             # Index by legal issues
             for issue in chunk.legal_issues:
-                if issue not in self.store.chunks_by_issue:
-                    self.store.chunks_by_issue[issue] = []
-                self.store.chunks_by_issue[issue].append(chunk.id)
+                self.store.chunks_by_issue.setdefault(issue, set()).add(chunk.id)
 
         for citation in citations:
             self.store.citations[citation.id] = citation
 
-        self._save()
-
     def get_brief(self, brief_id: str):
         """Get a brief by ID."""
-        return self.store.briefs.get(brief_id)
+        with self._lock:
+            return self.store.briefs.get(brief_id)
+
+    def get_briefs(self, brief_ids: Iterable[str]) -> dict[str, Brief]:
+        """Get several briefs by ID. IDs with no brief are left out."""
+        briefs = self.store.briefs
+        with self._lock:
+            return {brief_id: briefs[brief_id] for brief_id in brief_ids if brief_id in briefs}
 
     def get_chunk(self, chunk_id: str):
         """Get a chunk by ID."""
-        return self.store.chunks.get(chunk_id)
+        with self._lock:
+            return self.store.chunks.get(chunk_id)
+
+    def get_chunks(self, chunk_ids: Iterable[str]) -> dict[str, ArgumentChunk]:
+        """Get several chunks by ID. IDs with no chunk are left out."""
+        chunks = self.store.chunks
+        with self._lock:
+            return {chunk_id: chunks[chunk_id] for chunk_id in chunk_ids if chunk_id in chunks}
+
+    def get_brief_chunks(self, brief_id: str) -> list[ArgumentChunk]:
+        """Get a brief's chunks, in order. Empty if there is no such brief."""
+        chunks = self.store.chunks
+        with self._lock:
+            return [
+                chunks[chunk_id]
+                for chunk_id in self.store.chunks_by_brief.get(brief_id, ())
+                if chunk_id in chunks
+            ]
+
+    def get_citations(self, citation_ids: Iterable[str]) -> dict[str, Citation]:
+        """Get several citations by ID. IDs with no citation are left out."""
+        citations = self.store.citations
+        with self._lock:
+            return {cit_id: citations[cit_id] for cit_id in citation_ids if cit_id in citations}
 
     def get_all_briefs(self):
         """Get all briefs."""
-        return list(self.store.briefs.values())
+        with self._lock:
+            return list(self.store.briefs.values())
 
     def get_all_chunks(self):
         """Get all chunks."""
-        return list(self.store.chunks.values())
+        with self._lock:
+            return list(self.store.chunks.values())
 
     def search_chunks(
         self,
@@ -236,48 +741,175 @@ class BriefBankStore:
         """
         Search chunks by semantic similarity.
 
-        Returns list of (chunk, score, match_reasons) tuples.
+        Returns list of (chunk, score, match_reasons) tuples. Repeated
+        searches are answered from a cache until the store changes.
+        Safe to call from worker threads.
         """
-        results = []
-
-        for chunk in self.store.chunks.values():
-            # Apply filters
-            if jurisdiction and chunk.jurisdiction != jurisdiction:
-                continue
-            if procedural_posture and chunk.procedural_posture:
-                if chunk.procedural_posture.value != procedural_posture:
-                    continue
-
-            # Compute similarity
-            chunk_text = generate_embedding_text(chunk)
-            score = compute_similarity(query, chunk_text)
-
-            if score > 0.05:  # Minimum threshold
-                match_reasons = []
+        key = (query, jurisdiction, procedural_posture, limit)
+        with self._lock:
+            matrix = self._search_matrix()
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                self._search_cache.move_to_end(key)
+                return list(cached[1])
+            dense = self.embedding_client is not None and matrix.vectors is not None
+
+        # The query is embedded without holding the lock: it is a network
+        # call, and other searches and writes need not wait for it
+        query_vector = None
+        if dense:
+            if not query.strip():
+                return []
+            query_vector = embed_texts([query], self.embedding_client, "query")[0]
+
+        with self._lock:
+            return self._scored_search(query, jurisdiction, procedural_posture, limit, key, query_vector)
+
+    def _scored_search(
+        self,
+        query: str,
+        jurisdiction: Optional[str],
+        procedural_posture: Optional[str],
+        limit: int,
+        key: tuple,
+        query_vector: Optional[np.ndarray]
+    ) -> list[tuple]:
+        """
+        Score the current search matrix against a query, as search_chunks.
 
-                if chunk.jurisdiction == jurisdiction:
-                    match_reasons.append(f"Same jurisdiction: {jurisdiction}")
-                    score *= 1.2  # Boost
+        query_vector is the query's dense embedding, or None for lexical
+        scoring. The caller holds the lock.
+        """
+        matrix = self._search_matrix()
+        query_words = tokenize(query)
+        row_count = len(matrix.chunk_ids)
+        # The store may have lost its dense vectors while the query was
+        # being embedded
+        dense = query_vector is not None and matrix.vectors is not None
+        if not dense:
+            query_vector = None
+
+        # A chunk's overlap with the query is the number of query-word
+        # postings its row appears in; bincount counts them for every
+        # chunk at once
+        def overlap(words) -> np.ndarray:
+            postings = [matrix.posting_rows[word] for word in words if word in matrix.posting_rows]
+            if not postings:
+                return np.zeros(row_count, dtype=np.int64)
+            return np.bincount(np.concatenate(postings), minlength=row_count)
+
+        shared_legal = overlap(query_words & LEGAL_TERMS)
+
+        if dense:
+            # Rows and query are normalized, so this is cosine similarity;
+            # the legal-term boost stays as a lexical signal on top
+            similar = self._similar_search(query_vector, key)
+            if similar is not None:
+                self._cache_search(key, query_vector, similar)
+                return list(similar)
+            scores = np.minimum(1.0, matrix.vectors @ query_vector + shared_legal * 0.1)
+        else:
+            # Only chunks sharing a word with the query can score above zero
+            shared = overlap(query_words)
+            if not shared.any():
+                return []
+            # Same arithmetic as score_tokens
+            jaccard = shared / (len(query_words) + matrix.token_counts - shared)
+            scores = np.minimum(1.0, jaccard + shared_legal * 0.1)
+
+        # Filters and boosts as masks over all rows. A chunk without a
+        # procedural posture passes the posture filter.
+        keep = scores > 0.05  # Minimum threshold
+        if jurisdiction:
+            keep &= matrix.jurisdictions == jurisdiction
+        posture_match = np.zeros(row_count, dtype=bool)
+        if procedural_posture:
+            posture_match = matrix.postures == procedural_posture
+            # == (not "is") compares elementwise
+            keep &= posture_match | (matrix.postures == None)
+
+        jurisdiction_match = matrix.jurisdictions == jurisdiction
+        scores = scores * np.where(jurisdiction_match, 1.2, 1.0)
+        scores = scores * np.where(posture_match, 1.2, 1.0)
+
+        rows = np.flatnonzero(keep)
+        row_scores = scores[rows]
+
+        # Only the top `limit` rows are needed, so select them in linear
+        # time before sorting. Rows tied with the cut-off score are taken
+        # in insertion order, as a full sort would.
+        if 0 < limit < len(rows):
+            cutoff = np.partition(row_scores, -limit)[-limit]
+            above = row_scores > cutoff
+            tied = np.flatnonzero(row_scores == cutoff)[:limit - np.count_nonzero(above)]
+            selected = np.sort(np.concatenate([np.flatnonzero(above), tied]))
+            rows, row_scores = rows[selected], row_scores[selected]
+
+        # Sort by score descending; a stable sort keeps insertion order
+        # among equal scores
+        rows = rows[np.argsort(-row_scores, kind="stable")][:limit]
 
-                if chunk.procedural_posture and procedural_posture:
-                    if chunk.procedural_posture.value == procedural_posture:
-                        match_reasons.append(f"Same procedural posture: {procedural_posture}")
-                        score *= 1.2  # Boost
+        results = []
+        for row in rows:
+            chunk = self.store.chunks[matrix.chunk_ids[row]]
+            match_reasons = []
 
-                if chunk.heading:
-                    match_reasons.append(f"Section: {chunk.heading}")
+            if jurisdiction_match[row]:
+                match_reasons.append(f"Same jurisdiction: {jurisdiction}")
+            if posture_match[row]:
+                match_reasons.append(f"Same procedural posture: {procedural_posture}")
+            if chunk.heading:
+                match_reasons.append(f"Section: {chunk.heading}")
 
-                results.append((chunk, score, match_reasons))
+            results.append((chunk, float(scores[row]), match_reasons))
 
-        # Sort by score descending
-        results.sort(key=lambda x: x[1], reverse=True)
+        self._cache_search(key, query_vector, results)
+        return list(results)
 
-        return results[:limit]
+    def _similar_search(self, query_vector: np.ndarray, key: tuple) -> Optional[list[tuple]]:
+        """
+        Results of a cached dense search with the same filters and limit
+        whose query embedding is near enough to query_vector, if any.
+        """
+        entries = [
+            (cached_key, cached_vector, results)
+            for cached_key, (cached_vector, results) in self._search_cache.items()
+            if cached_vector is not None and cached_key[1:] == key[1:]
+        ]
+        if not entries:
+            return None
+
+        # Embeddings are normalized, so the dot product is cosine similarity
+        similarity = np.stack([entry[1] for entry in entries]) @ query_vector
+        best = int(np.argmax(similarity))
+        if similarity[best] < SEMANTIC_CACHE_THRESHOLD:
+            return None
+        self._search_cache.move_to_end(entries[best][0])
+        return entries[best][2]
+
+    def _cache_search(self, key: tuple, query_vector: Optional[np.ndarray], results: list[tuple]):
+        """Remember a search, evicting the least recently used beyond SEARCH_CACHE_SIZE."""
+        self._search_cache[key] = (query_vector, results)
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
 
     def delete_brief(self, brief_id: str):
         """Delete a brief and its chunks."""
+        with self._lock:
+            if brief_id in self.store.briefs:
+                record = _StoreRecord.model_construct(delete=brief_id)
+                self._append(_STORE_RECORD.dump_json(record, include={"delete"}) + b"\n")
+                self._remove_brief(brief_id)
+
+    def _remove_brief(self, brief_id: str) -> bool:
+        """
+        Remove a brief and its chunks from the in-memory store and indexes.
+
+        Returns False if there is no such brief.
+        """
         if brief_id not in self.store.briefs:
-            return
+            return False
 
         # Remove chunks
         chunk_ids = self.store.chunks_by_brief.get(brief_id, [])
@@ -287,17 +919,11 @@ class BriefBankStore:
                 # Remove from issue index
                 for issue in chunk.legal_issues:
                     if issue in self.store.chunks_by_issue:
-                        self.store.chunks_by_issue[issue] = [
-                            cid for cid in self.store.chunks_by_issue[issue]
-                            if cid != chunk_id
-                        ]
+                        self.store.chunks_by_issue[issue].discard(chunk_id)
 
                 # Remove from jurisdiction index
                 if chunk.jurisdiction and chunk.jurisdiction in self.store.chunks_by_jurisdiction:
-                    self.store.chunks_by_jurisdiction[chunk.jurisdiction] = [
-                        cid for cid in self.store.chunks_by_jurisdiction[chunk.jurisdiction]
-                        if cid != chunk_id
-                    ]
+                    self.store.chunks_by_jurisdiction[chunk.jurisdiction].discard(chunk_id)
 
                 # Remove citations
                 for cit_id in chunk.citations:
@@ -305,10 +931,13 @@ class BriefBankStore:
                         del self.store.citations[cit_id]
 
                 del self.store.chunks[chunk_id]
+                self._unindex_tokens(chunk_id)
+                self._chunk_rank.pop(chunk_id, None)
+                self._chunk_vectors.pop(chunk_id, None)
 
         # Remove brief
         del self.store.briefs[brief_id]
         if brief_id in self.store.chunks_by_brief:
             del self.store.chunks_by_brief[brief_id]
 
-        self._save()
+        return True
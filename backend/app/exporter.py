@@ -5,15 +5,31 @@ Generates properly formatted Word documents from draft briefs,
 preserving legal document formatting conventions.
 """
 
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO, Optional
 from datetime import datetime
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 
 from .models import DraftBrief, GeneratedSection
 
+# Characters a run's text is split on: each becomes its own element
+_RUN_BREAKS = re.compile(r'([\t\r\n])')
+
+# Export directories already created by this process, so repeated exports
+# skip the mkdir
+_ENSURED_DIRS: set[Path] = set()
+
 
 def create_brief_document(draft: DraftBrief, output_path: Path) -> Path:
     """
@@ -25,10 +41,33 @@ def create_brief_document(draft: DraftBrief, output_path: Path) -> Path:
     - Double-spaced body text
     - Proper heading hierarchy
     """
-    doc = Document()
+    doc = _build_document(draft)
+
+    # Save document
+    output_path = Path(output_path)
+    _ensure_dir(output_path.parent)
+    try:
+        doc.save(output_path)
+    except FileNotFoundError:
+        # The directory was removed since it was created
+        _ENSURED_DIRS.discard(output_path.parent)
+        _ensure_dir(output_path.parent)
+        doc.save(output_path)
+
+    return output_path
+
+
+def write_brief_document(draft: DraftBrief, out: BinaryIO):
+    """
+    Write a draft brief as DOCX to a binary stream, formatted as by
+    create_brief_document but without touching the filesystem.
+    """
+    _build_document(draft).save(out)
 
-    # Set up styles
-    _setup_styles(doc)
+
+def _build_document(draft: DraftBrief) -> Document:
+    """Build the document for a draft brief."""
+    doc = Document(BytesIO(_template_bytes()))
 
     # Add caption/header
     _add_caption(doc, draft)
@@ -40,12 +79,28 @@ def create_brief_document(draft: DraftBrief, output_path: Path) -> Path:
     # Add signature block placeholder
     _add_signature_block(doc)
 
-    # Save document
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(output_path)
+    return doc
 
-    return output_path
+
+def _ensure_dir(path: Path):
+    """Create a directory unless this process already has."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+@lru_cache(maxsize=None)
+def _template_bytes() -> bytes:
+    """
+    A blank document with the brief styles and margins, built once.
+
+    Every export opens a copy of it instead of setting up styles again.
+    """
+    doc = Document()
+    _setup_styles(doc)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
 
 
 def _setup_styles(doc: Document):
@@ -95,23 +150,61 @@ def _setup_styles(doc: Document):
     heading2.paragraph_format.space_after = Pt(6)
 
 
-def _add_caption(doc: Document, draft: DraftBrief):
-    """Add the case caption to the document."""
-    matter = draft.matter
+def _run(text: str = "", bold: bool = False):
+    """
+    Build a <w:r> element holding text, as Paragraph.add_run does.
 
-    # Court name (centered, all caps)
-    court_para = doc.add_paragraph()
-    court_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = court_para.add_run(matter.court.upper())
-    run.bold = True
+    Tabs become <w:tab/> and newlines or carriage returns <w:br/>.
+    """
+    run = OxmlElement('w:r')
+    if bold:
+        properties = OxmlElement('w:rPr')
+        properties.append(OxmlElement('w:b'))
+        run.append(properties)
+
+    for piece in _RUN_BREAKS.split(text):
+        if piece == '\t':
+            run.append(OxmlElement('w:tab'))
+        elif piece in ('\r', '\n'):
+            run.append(OxmlElement('w:br'))
+        elif piece:
+            t = OxmlElement('w:t')
+            t.text = piece
+            if len(piece.strip()) < len(piece):
+                t.set(qn('xml:space'), 'preserve')
+            run.append(t)
+    return run
+
+
+def _paragraph(*runs, style: str = None, alignment: WD_ALIGN_PARAGRAPH = None):
+    """
+    Build a <w:p> element from run elements.
+
+    style is a style ID, set directly rather than looked up by name.
+    """
+    paragraph = OxmlElement('w:p')
+    if style is not None or alignment is not None:
+        properties = OxmlElement('w:pPr')
+        if style is not None:
+            properties.append(OxmlElement('w:pStyle', {qn('w:val'): style}))
+        if alignment is not None:
+            properties.append(OxmlElement('w:jc', {qn('w:val'): WD_ALIGN_PARAGRAPH.to_xml(alignment)}))
+        paragraph.append(properties)
+    paragraph.extend(runs)
+    return paragraph
+
+
+def _append_paragraphs(doc: Document, paragraphs: list):
+    """Append paragraph elements to the document body in one insertion."""
+    body = doc.element.body
+    # Body content goes before the final section properties
+    end = body.index(body.sectPr) if body.sectPr is not None else len(body)
+    body[end:end] = paragraphs
 
-    # Blank line
-    doc.add_paragraph()
 
-    # Case name and number in a simple format
-    # Left side: plaintiff info
-    case_para = doc.add_paragraph()
-    case_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
+def _add_caption(doc: Document, draft: DraftBrief):
+    """Add the case caption to the document."""
+    matter = draft.matter
 
     # Simple case caption
     lines = [
@@ -121,73 +214,68 @@ def _add_caption(doc: Document, draft: DraftBrief):
         "",
         f"{matter.procedural_posture.value.upper().replace('_', ' ')}",
     ]
-
+    caption_runs = []
     for i, line in enumerate(lines):
         if i > 0:
-            case_para.add_run("\n")
-        run = case_para.add_run(line)
-        if i == 0:  # Case name
-            run.bold = True
-
-    # Horizontal line
-    doc.add_paragraph("_" * 60)
-    doc.add_paragraph()
+            caption_runs.append(_run("\n"))
+        caption_runs.append(_run(line, bold=(i == 0)))  # Case name in bold
+
+    _append_paragraphs(doc, [
+        # Court name (centered, all caps)
+        _paragraph(_run(matter.court.upper(), bold=True), alignment=WD_ALIGN_PARAGRAPH.CENTER),
+        # Blank line
+        _paragraph(),
+        # Case name and number in a simple format
+        _paragraph(*caption_runs, alignment=WD_ALIGN_PARAGRAPH.LEFT),
+        # Horizontal line
+        _paragraph(_run("_" * 60)),
+        _paragraph(),
+    ])
 
 
 def _add_section(doc: Document, section: GeneratedSection):
     """Add a generated section to the document."""
     # Add heading
-    heading_para = doc.add_paragraph(section.heading, style='BriefHeading1')
+    paragraphs = [_paragraph(_run(section.heading), style='BriefHeading1')]
 
     # Add content
     # Split content by paragraphs and add each
-    paragraphs = section.content.split('\n\n')
-    for para_text in paragraphs:
+    for para_text in section.content.split('\n\n'):
         para_text = para_text.strip()
         if not para_text:
             continue
 
-        para = doc.add_paragraph(para_text)
+        paragraphs.append(_paragraph(_run(para_text)))
 
         # Highlight [CITATION NEEDED] and [FACT PLACEHOLDER] markers
         # (In production, you'd use runs with highlighting)
 
     # Add warnings as comments/notes if present
     if section.warnings:
-        warning_para = doc.add_paragraph()
-        warning_para.add_run("[REVIEW NOTES: ").bold = True
-        for warning in section.warnings:
-            warning_para.add_run(f"• {warning} ")
-        warning_para.add_run("]").bold = True
+        paragraphs.append(_paragraph(
+            _run("[REVIEW NOTES: ", bold=True),
+            *(_run(f"• {warning} ") for warning in section.warnings),
+            _run("]", bold=True),
+        ))
 
-    doc.add_paragraph()  # Space after section
+    paragraphs.append(_paragraph())  # Space after section
+    _append_paragraphs(doc, paragraphs)
 
 
 def _add_signature_block(doc: Document):
     """Add signature block placeholder."""
-    doc.add_paragraph()
-    doc.add_paragraph()
-
-    sig_para = doc.add_paragraph()
-    sig_para.add_run("Respectfully submitted,")
-
-    doc.add_paragraph()
-    doc.add_paragraph()
-
-    sig_line = doc.add_paragraph()
-    sig_line.add_run("_" * 40)
-
-    attorney_para = doc.add_paragraph()
-    attorney_para.add_run("[ATTORNEY NAME]")
-
-    firm_para = doc.add_paragraph()
-    firm_para.add_run("[FIRM NAME]")
-
-    address_para = doc.add_paragraph()
-    address_para.add_run("[ADDRESS]")
-
-    date_para = doc.add_paragraph()
-    date_para.add_run(f"Dated: {datetime.now().strftime('%B %d, %Y')}")
+    _append_paragraphs(doc, [
+        _paragraph(),
+        _paragraph(),
+        _paragraph(_run("Respectfully submitted,")),
+        _paragraph(),
+        _paragraph(),
+        _paragraph(_run("_" * 40)),
+        _paragraph(_run("[ATTORNEY NAME]")),
+        _paragraph(_run("[FIRM NAME]")),
+        _paragraph(_run("[ADDRESS]")),
+        _paragraph(_run(f"Dated: {datetime.now().strftime('%B %d, %Y')}")),
+    ])
 
 
 def export_draft(draft: DraftBrief, output_dir: Path = None) -> Path:
@@ -199,14 +287,44 @@ def export_draft(draft: DraftBrief, output_dir: Path = None) -> Path:
     if output_dir is None:
         output_dir = Path(__file__).parent.parent.parent / "data" / "exports"
 
+    # create_brief_document creates the directory if needed
     output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate filename from case name and timestamp
+    output_path = output_dir / export_filename(draft)
+
+    return create_brief_document(draft, output_path)
+
+
+def export_filename(draft: DraftBrief) -> str:
+    """A DOCX filename for a draft, from its case name, the current time and its ID.
+
+    The ID keeps drafts for the same matter exported in the same second
+    from overwriting each other.
+    """
     case_name = draft.matter.case_name.replace(" ", "_").replace(".", "")[:30]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{case_name}_{timestamp}.docx"
+    return f"{case_name}_{timestamp}_{draft.id}.docx"
 
-    output_path = output_dir / filename
 
-    return create_brief_document(draft, output_path)
+def export_drafts(
+    drafts: list[DraftBrief],
+    output_dir: Path = None,
+    max_workers: Optional[int] = None
+) -> list[Path]:
+    """
+    Export several draft briefs to DOCX, in parallel processes when there is more than one.
+
+    Returns the exported paths in the order of drafts. Document building
+    is CPU-bound, so processes rather than threads; each worker builds
+    the styled template once and reuses it for every draft it is given.
+    Workers are started by a forkserver, so they are never forked from a
+    multi-threaded caller such as the API server.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(drafts))
+    if workers <= 1:
+        return [export_draft(draft, output_dir) for draft in drafts]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("forkserver")
+    ) as executor:
+        return list(executor.map(partial(export_draft, output_dir=output_dir), drafts))
@@ -8,57 +8,208 @@ Handles:
 - Transparent adaptation with source tracking
 """
 
+import asyncio
+import hashlib
+import json
 import os
 import re
+import time
 import uuid
-from typing import Optional
-from anthropic import Anthropic
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
+import numpy as np
+from anthropic import AsyncAnthropic
+from anthropic.types import Message
+from pydantic import ValidationError
 
 from .models import (
     NewMatterRequest, ArgumentChunk, RetrievalResult,
-    OutlineSection, GeneratedSection, DraftBrief, Citation
+    OutlineSection, GeneratedSection, DraftBrief, Brief, Citation
 )
-from .embeddings import BriefBankStore
+from .embeddings import BriefBankStore, embed_texts, get_anthropic_client
+
+
+# Outline prompts list at most this many retrieved sources, each with an
+# excerpt of this many characters; section prompts include at most this
+# many characters of each source chunk
+OUTLINE_MAX_SOURCES = 8
+OUTLINE_EXCERPT_CHARS = 350
+SECTION_SOURCE_MAX_CHARS = 6000
+
+# Outlines remembered for reuse, least recently used evicted first. A
+# matter reuses the outline of one whose outline prompt is the same or,
+# with dense embeddings, of one in the same case and court whose prompt
+# embedding is at least this similar. Outlines name parties and facts, so
+# they are never shared across cases.
+OUTLINE_CACHE_SIZE = 256
+OUTLINE_CACHE_THRESHOLD = 0.93
+
+# SHA-256 of the outline prompt -> ((case name, court), prompt embedding
+# or None, the model's outline sections)
+_outline_cache: OrderedDict[
+    str, tuple[tuple[str, str], Optional[np.ndarray], list[dict]]
+] = OrderedDict()
+
+# Opening and closing code fence wrapping an outline response's JSON
+OUTLINE_FENCE_RE = re.compile(r'^```\w*\s*|```\s*$')
+
+# Markdown artifacts removed from generated section text
+CODE_FENCE_RE = re.compile(r'```\w*\s*')
+MARKDOWN_HEADER_RE = re.compile(r'#{1,6}\s*')  # matched at line starts only
+EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+
+_JSON_DECODER = json.JSONDecoder()
+
+# (heading, description) of each section of the fallback outline; a None
+# description is filled in from the matter's procedural posture
+DEFAULT_OUTLINE = (
+    ("I. INTRODUCTION", "Overview of the motion and relief sought"),
+    ("II. STATEMENT OF FACTS", "Relevant factual background"),
+    ("III. LEGAL STANDARD", None),
+    ("IV. ARGUMENT", "Legal arguments supporting the motion"),
+    ("V. CONCLUSION", "Summary and request for relief"),
+)
+
+# Seconds between status checks on a submitted Message Batch
+BATCH_POLL_INTERVAL = 30
+
+# With BRIEF_BANK_LLM_CACHE=1, Claude's responses are cached on disk, one
+# file per distinct request, for this many seconds. Meant for development,
+# tests and repeated regenerations: identical prompts get identical text.
+RESPONSE_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "llm_cache"
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+
+# The instructions are the same on every call, so they go in a cached
+# system block and only the matter, sources and citations are sent as
+# fresh input each time.
+OUTLINE_INSTRUCTIONS = """You are helping draft a legal brief. Based on the matter details and retrieved source material from the firm's brief bank, propose an outline for the brief.
+
+INSTRUCTIONS:
+1. Propose an outline with 4-7 main sections appropriate for this type of motion
+2. For each section, identify which source materials (by number) would be most useful
+3. Consider the standard structure for this procedural posture
+4. Include Introduction, Statement of Facts placeholder, Argument sections, and Conclusion
+
+Return the outline in this exact JSON format:
+{
+  "sections": [
+    {
+      "heading": "I. INTRODUCTION",
+      "description": "Brief overview of the motion and relief sought",
+      "source_indices": [1, 3],
+      "order": 0
+    },
+    ...
+  ]
+}
+
+Return ONLY valid JSON, no other text."""
+
+SECTION_INSTRUCTIONS = """You are drafting a section of a legal brief. Generate content for the section you are given using ONLY the provided source material.
+
+CRITICAL INSTRUCTIONS:
+1. NEVER invent or hallucinate citations. Only use the available citations you are given.
+2. If a statement needs a citation but none is available, write [CITATION NEEDED].
+3. Adapt the source material to this specific case and facts.
+4. Use [FACT PLACEHOLDER: description] where case-specific facts are needed.
+5. Maintain professional legal writing style.
+6. If this is a STATEMENT OF FACTS section, use mostly placeholders since facts are case-specific.
+
+WARNINGS TO CHECK:
+- If you reference client names from source material, note this for removal
+- If citations are more than 5 years old, note they should be verified
+- If using authority from a different jurisdiction, note it's persuasive only
+
+Write the section content. After the content, provide a JSON block with:
+{
+  "citations_used": ["full citation text", ...],
+  "citations_needed": ["description of what needs citation", ...],
+  "warnings": ["any safety warnings", ...],
+  "adaptations": [
+    {"original": "original text excerpt", "adapted": "how you adapted it"}
+  ]
+}"""
+
 
+async def _create_message(client: AsyncAnthropic, params: dict) -> Message:
+    """
+    client.messages.create(**params), answered from the response cache
+    when it is enabled (see RESPONSE_CACHE_DIR).
 
-def get_anthropic_client() -> Anthropic:
-    """Get Anthropic client from environment."""
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-    return Anthropic(api_key=api_key)
+    The cache file is read and written in a worker thread, so concurrent
+    requests don't block the event loop on disk.
+    """
+    if os.environ.get("BRIEF_BANK_LLM_CACHE") != "1":
+        return await client.messages.create(**params)
 
+    key = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    path = RESPONSE_CACHE_DIR / f"{key}.json"
+
+    def read() -> Optional[Message]:
+        try:
+            if time.time() - path.stat().st_mtime < RESPONSE_CACHE_TTL:
+                return Message.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            pass
+        return None
 
-def generate_outline(
+    def write(response: Message):
+        # Written alongside and renamed, so readers never see a partial file
+        RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(response.model_dump_json())
+        tmp_path.replace(path)
+
+    cached = await asyncio.to_thread(read)
+    if cached is not None:
+        return cached
+
+    response = await client.messages.create(**params)
+    await asyncio.to_thread(write, response)
+    return response
+
+
+async def generate_outline(
     matter: NewMatterRequest,
     retrieved_chunks: list[RetrievalResult],
-    client: Optional[Anthropic] = None
+    client: Optional[AsyncAnthropic] = None,
+    embedding_client=None
 ) -> list[OutlineSection]:
     """
     Generate a proposed outline for the brief based on retrieved source material.
 
     This proposes a structure before generating prose, allowing the user
-    to shape the argument organization.
+    to shape the argument organization. A matter whose outline prompt
+    is identical to one already sent reuses that outline without calling
+    Claude; embedding_client, if given, extends the match to near-identical
+    prompts for the same case and court.
     """
     client = client or get_anthropic_client()
 
-    # Build context from retrieved chunks
+    # Build context from retrieved chunks, one line per source, skipping
+    # chunks that open like one already listed. A source's number is its
+    # rank in retrieved_chunks, which is what source_indices refer to.
     source_summaries = []
-    for i, result in enumerate(retrieved_chunks[:10]):  # Top 10 for context
+    seen_openings = set()
+    for rank, result in enumerate(retrieved_chunks, start=1):
+        if len(source_summaries) == OUTLINE_MAX_SOURCES:
+            break
         chunk = result.chunk
-        summary = f"""
-Source {i+1} (Score: {result.score:.2f}):
-- Heading: {chunk.heading or 'No heading'}
-- Type: {chunk.section_type.value}
-- From: {result.source_brief_title or 'Unknown'}
-- Court: {chunk.court or 'Unknown'}
-- Excerpt: {chunk.content[:500]}...
-"""
-        source_summaries.append(summary)
-
-    prompt = f"""You are helping draft a legal brief. Based on the matter details and retrieved source material from the firm's brief bank, propose an outline for the brief.
+        opening = " ".join(chunk.content[:120].lower().split())
+        if opening in seen_openings:
+            continue
+        seen_openings.add(opening)
+
+        source_summaries.append(
+            f"Source {rank} [score {result.score:.2f}, {chunk.section_type.value}, "
+            f"from {result.source_brief_title or 'Unknown'}, {chunk.court or 'Unknown court'}] "
+            f"{_one_line(chunk.heading or 'No heading')}: "
+            f"{_one_line(chunk.content[:OUTLINE_EXCERPT_CHARS])}..."
+        )
 
-MATTER DETAILS:
+    prompt = f"""MATTER DETAILS:
 - Case: {matter.case_name}
 - Court: {matter.court}
 - Jurisdiction: {matter.jurisdiction}
@@ -68,67 +219,177 @@ MATTER DETAILS:
 - Desired Outcome: {matter.desired_outcome}
 
 RETRIEVED SOURCE MATERIAL:
-{chr(10).join(source_summaries)}
-
-INSTRUCTIONS:
-1. Propose an outline with 4-7 main sections appropriate for this type of motion
-2. For each section, identify which source materials (by number) would be most useful
-3. Consider the standard structure for this procedural posture
-4. Include Introduction, Statement of Facts placeholder, Argument sections, and Conclusion
-
-Return the outline in this exact JSON format:
-{{
-  "sections": [
-    {{
-      "heading": "I. INTRODUCTION",
-      "description": "Brief overview of the motion and relief sought",
-      "source_indices": [1, 3],
-      "order": 0
-    }},
-    ...
-  ]
-}}
-
-Return ONLY valid JSON, no other text."""
-
-    response = client.messages.create(
+{chr(10).join(source_summaries)}"""
+
+    key = hashlib.sha256(prompt.encode()).hexdigest()
+    scope = (matter.case_name, matter.court)
+    key_vector = None
+    if embedding_client is not None:
+        key_vector = (await asyncio.to_thread(embed_texts, [prompt], embedding_client, "query"))[0]
+    cached = _cached_outline(key, scope, key_vector)
+    if cached is not None:
+        return _outline_sections(cached, retrieved_chunks)
+
+    response = await _create_message(client, dict(
         model="claude-sonnet-4-20250514",
         max_tokens=2000,
+        system=[{
+            "type": "text",
+            "text": OUTLINE_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"},
+        }],
         messages=[{"role": "user", "content": prompt}]
-    )
+    ))
 
     try:
-        import json
         # Clean up potential markdown code block wrapping around JSON
         response_text = response.content[0].text
-        response_text = re.sub(r'^```\w*\s*', '', response_text.strip())
-        response_text = re.sub(r'```\s*$', '', response_text.strip())
+        response_text = OUTLINE_FENCE_RE.sub('', response_text.strip())
         result = json.loads(response_text)
 
-        outline_sections = []
-        for section_data in result.get("sections", []):
-            # Map source indices to actual chunk IDs
-            source_chunk_ids = []
-            for idx in section_data.get("source_indices", []):
-                if 0 < idx <= len(retrieved_chunks):
-                    source_chunk_ids.append(retrieved_chunks[idx-1].chunk.id)
-
-            section = OutlineSection(
-                id=str(uuid.uuid4()),
-                heading=section_data["heading"],
-                description=section_data["description"],
-                source_chunks=source_chunk_ids,
-                order=section_data.get("order", 0)
-            )
-            outline_sections.append(section)
-
-        return sorted(outline_sections, key=lambda s: s.order)
+        sections_data = result.get("sections", [])
+        outline_sections = _outline_sections(sections_data, retrieved_chunks)
+        if outline_sections:
+            _cache_outline(key, scope, key_vector, sections_data)
+        return outline_sections
 
     except (json.JSONDecodeError, KeyError) as e:
         # Fallback to default outline
         return _default_outline(matter)
 
 
+def _outline_sections(sections_data: list[dict], retrieved_chunks: list[RetrievalResult]) -> list[OutlineSection]:
+    """
+    Build outline sections, with fresh IDs, from the model's JSON sections.
+
+    Sources are referred to by 1-based rank in retrieved_chunks, so a
+    cached outline picks up the chunks retrieved for the new matter.
+    """
+    outline_sections = []
+    for section_data in sections_data:
+        # Map source indices to actual chunk IDs
+        source_chunk_ids = []
+        for idx in section_data.get("source_indices", []):
+            if 0 < idx <= len(retrieved_chunks):
+                source_chunk_ids.append(retrieved_chunks[idx-1].chunk.id)
+
+        section = OutlineSection(
+            id=str(uuid.uuid4()),
+            heading=section_data["heading"],
+            description=section_data["description"],
+            source_chunks=source_chunk_ids,
+            order=section_data.get("order", 0)
+        )
+        outline_sections.append(section)
+
+    return sorted(outline_sections, key=lambda s: s.order)
+
+
+def _cached_outline(
+    key: str,
+    scope: tuple[str, str],
+    key_vector: Optional[np.ndarray]
+) -> Optional[list[dict]]:
+    """
+    Outline sections cached for this key, or for the most similar key near
+    enough in the same (case name, court) scope.
+    """
+    if key not in _outline_cache and key_vector is not None:
+        entries = [
+            (cached_key, cached_vector)
+            for cached_key, (cached_scope, cached_vector, _) in _outline_cache.items()
+            if cached_scope == scope and cached_vector is not None
+        ]
+        if entries:
+            # Embeddings are normalized, so the dot product is cosine similarity
+            similarity = np.stack([entry[1] for entry in entries]) @ key_vector
+            best = int(np.argmax(similarity))
+            if similarity[best] >= OUTLINE_CACHE_THRESHOLD:
+                key = entries[best][0]
+
+    if key not in _outline_cache:
+        return None
+    _outline_cache.move_to_end(key)
+    return _outline_cache[key][2]
+
+
+def _cache_outline(
+    key: str,
+    scope: tuple[str, str],
+    key_vector: Optional[np.ndarray],
+    sections_data: list[dict]
+):
+    """Remember an outline, evicting the least recently used beyond OUTLINE_CACHE_SIZE."""
+    _outline_cache[key] = (scope, key_vector, sections_data)
+    _outline_cache.move_to_end(key)
+    while len(_outline_cache) > OUTLINE_CACHE_SIZE:
+        _outline_cache.popitem(last=False)
+
+
+def _trailing_json_object(text: str, key: str) -> tuple[Optional[dict], int]:
+    """
+    Find the JSON object containing key that the model wrote after its text.
+
+    Decodes one JSON value from each "{" before the key's last occurrence,
+    nearest first, until one is an object with that key; braces inside
+    strings and any text after the object don't get in the way. Returns
+    the object and its offset in text, or (None, -1).
+    """
+    end = text.rfind(f'"{key}"')
+    while end > 0:
+        start = text.rfind("{", 0, end)
+        if start < 0:
+            break
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(value, dict) and key in value:
+                return value, start
+        end = start
+    return None, -1
+
+
+def _one_line(text: str) -> str:
+    """Text with every run of whitespace, newlines included, collapsed to a space."""
+    return " ".join(text.split())
+
+
+def _normalize_citation_text(text: str) -> str:
+    """Citation text lowercased with runs of whitespace collapsed, for matching."""
+    return " ".join(text.lower().split())
+
+
+def _strip_markdown_headers(text: str) -> str:
+    r"""
+    Remove markdown header markers, and the whitespace after them, from
+    the start of lines.
+
+    Same result as re.sub(r'^#{1,6}\s*', '', text, flags=re.MULTILINE),
+    but str.find locates the lines starting with "#", so the regex runs
+    only there rather than being tried at every character.
+    """
+    def next_header(pos: int) -> int:
+        newline = text.find('\n#', pos)
+        return newline + 1 if newline >= 0 else -1
+
+    pieces = []
+    copied = 0
+    start = 0 if text.startswith('#') else next_header(0)
+    while start >= 0:
+        end = MARKDOWN_HEADER_RE.match(text, start).end()
+        pieces.append(text[copied:start])
+        copied = end
+        # The match may end just after a newline, at another header
+        start = next_header(end - 1)
+
+    if not pieces:
+        return text
+    pieces.append(text[copied:])
+    return ''.join(pieces)
+
+
 def _clean_markdown_artifacts(text: str) -> str:
     """
     Remove markdown formatting artifacts from generated text.
@@ -138,17 +399,17 @@ def _clean_markdown_artifacts(text: str) -> str:
     - Markdown headers (###, ##, etc.) that shouldn't appear in legal briefs
     - Extra whitespace from removed artifacts
     """
-    # Remove code block markers (```json, ```python, ```, etc.)
-    text = re.sub(r'```\w*\s*', '', text)
-    text = re.sub(r'```', '', text)
+    # Remove code block markers (```json, ```python, ```, etc.). One pass
+    # suffices: removing a marker can't join backticks into a new one.
+    text = CODE_FENCE_RE.sub('', text)
 
     # Remove markdown headers that appear mid-text (### A., ## B., etc.)
     # Keep Roman numeral headers like "I. INTRODUCTION" but remove markdown #
     # Only remove # at start of lines, not # in middle of text
-    text = re.sub(r'^#{1,6}\s*', '', text, flags=re.MULTILINE)
+    text = _strip_markdown_headers(text)
 
     # Clean up any leftover empty lines from removed content
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = EXTRA_NEWLINES_RE.sub('\n\n', text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -158,51 +419,23 @@ def _clean_markdown_artifacts(text: str) -> str:
 
 def _default_outline(matter: NewMatterRequest) -> list[OutlineSection]:
     """Generate a default outline when AI fails."""
-    sections = [
+    return [
         OutlineSection(
             id=str(uuid.uuid4()),
-            heading="I. INTRODUCTION",
-            description="Overview of the motion and relief sought",
+            heading=heading,
+            description=description or f"Standard for {matter.procedural_posture.value}",
             source_chunks=[],
-            order=0
-        ),
-        OutlineSection(
-            id=str(uuid.uuid4()),
-            heading="II. STATEMENT OF FACTS",
-            description="Relevant factual background",
-            source_chunks=[],
-            order=1
-        ),
-        OutlineSection(
-            id=str(uuid.uuid4()),
-            heading="III. LEGAL STANDARD",
-            description=f"Standard for {matter.procedural_posture.value}",
-            source_chunks=[],
-            order=2
-        ),
-        OutlineSection(
-            id=str(uuid.uuid4()),
-            heading="IV. ARGUMENT",
-            description="Legal arguments supporting the motion",
-            source_chunks=[],
-            order=3
-        ),
-        OutlineSection(
-            id=str(uuid.uuid4()),
-            heading="V. CONCLUSION",
-            description="Summary and request for relief",
-            source_chunks=[],
-            order=4
-        ),
+            order=order
+        )
+        for order, (heading, description) in enumerate(DEFAULT_OUTLINE)
     ]
-    return sections
 
 
-def generate_section(
+async def generate_section(
     section: OutlineSection,
     matter: NewMatterRequest,
     store: BriefBankStore,
-    client: Optional[Anthropic] = None
+    client: Optional[AsyncAnthropic] = None
 ) -> GeneratedSection:
     """
     Generate a single section of the brief.
@@ -215,15 +448,105 @@ def generate_section(
     """
     client = client or get_anthropic_client()
 
-    # Gather source chunks
+    sources = await _gather_sources(section, store)
+    params, source_chunks, all_citations = _prepare_section(section, matter, sources)
+    response = await _create_message(client, params)
+    return _parse_section(section, response.content[0].text, source_chunks, all_citations)
+
+
+async def stream_section(
+    section: OutlineSection,
+    matter: NewMatterRequest,
+    store: BriefBankStore,
+    client: Optional[AsyncAnthropic] = None
+) -> AsyncIterator[Union[str, GeneratedSection]]:
+    """
+    Generate a single section of the brief, yielding its text as it is written.
+
+    Yields pieces of text as Claude streams them, then the finished
+    GeneratedSection, as generate_section would return it. The streamed
+    text is a raw preview: markdown artifacts are not yet cleaned, and it
+    stops where the trailing JSON metadata begins (the first "{").
+    """
+    client = client or get_anthropic_client()
+
+    sources = await _gather_sources(section, store)
+    params, source_chunks, all_citations = _prepare_section(section, matter, sources)
+    pieces = []
+    in_metadata = False
+    async with client.messages.stream(**params) as stream:
+        async for text in stream.text_stream:
+            pieces.append(text)
+            if in_metadata:
+                continue
+            brace = text.find("{")
+            if brace >= 0:
+                in_metadata = True
+                text = text[:brace]
+            if text:
+                yield text
+
+    yield _parse_section(section, "".join(pieces), source_chunks, all_citations)
+
+
+async def _gather_sources(
+    section: OutlineSection,
+    store: BriefBankStore
+) -> tuple[dict[str, ArgumentChunk], dict[str, Brief], dict[str, Citation]]:
+    """
+    Fetch a section's source chunks with their briefs and citations.
+
+    The lookups run in a worker thread, so sections generated
+    concurrently don't block the event loop on the store.
+    """
+    def lookup():
+        # One bulk call each for chunks, briefs and citations
+        chunks = store.get_chunks(section.source_chunks)
+        briefs = store.get_briefs({chunk.brief_id for chunk in chunks.values()})
+        citations = store.get_citations(
+            cit_id for chunk in chunks.values() for cit_id in chunk.citations
+        )
+        return chunks, briefs, citations
+
+    return await asyncio.to_thread(lookup)
+
+
+def _prepare_section(
+    section: OutlineSection,
+    matter: NewMatterRequest,
+    sources: tuple[dict[str, ArgumentChunk], dict[str, Brief], dict[str, Citation]]
+) -> tuple[dict, list[RetrievalResult], list[Citation]]:
+    """
+    Build a section's request from its sources (see _gather_sources).
+
+    Returns the messages.create parameters, the section's sources and the
+    citations available to it.
+    """
+    chunks, briefs, citations = sources
+
+    # The prompt is assembled as a list of parts joined once at the end,
+    # so each source's content (up to SECTION_SOURCE_MAX_CHARS) is copied
+    # into the prompt only once
+    prompt_parts = [f"""SECTION TO DRAFT:
+Heading: {section.heading}
+Description: {section.description}
+
+MATTER CONTEXT:
+- Case: {matter.case_name}
+- Court: {matter.court}
+- Procedural Posture: {matter.procedural_posture.value}
+- Legal Issues: {', '.join(matter.legal_issues)}
+- Facts: {matter.fact_summary}
+
+SOURCE MATERIAL TO DRAW FROM:
+"""]
     source_chunks = []
-    source_texts = []
     all_citations = []
 
     for chunk_id in section.source_chunks:
-        chunk = store.get_chunk(chunk_id)
+        chunk = chunks.get(chunk_id)
         if chunk:
-            brief = store.get_brief(chunk.brief_id)
+            brief = briefs.get(chunk.brief_id)
 
             result = RetrievalResult(
                 chunk=chunk,
@@ -232,78 +555,61 @@ def generate_section(
                 source_brief_title=brief.title if brief else None,
                 source_brief_outcome=brief.outcome if brief else None
             )
+            if source_chunks:
+                prompt_parts.append("\n")
             source_chunks.append(result)
 
-            source_texts.append(f"""
+            content = chunk.content
+            if len(content) > SECTION_SOURCE_MAX_CHARS:
+                content = content[:SECTION_SOURCE_MAX_CHARS] + "..."
+            prompt_parts += (f"""
 SOURCE (from {brief.title if brief else 'Unknown'}):
 Heading: {chunk.heading or 'No heading'}
 Content:
-{chunk.content}
-""")
+""", content, "\n")
 
             # Collect citations from this chunk
             for cit_id in chunk.citations:
-                cit = store.store.citations.get(cit_id)
+                cit = citations.get(cit_id)
                 if cit:
                     all_citations.append(cit)
 
+    if not source_chunks:
+        prompt_parts.append("No source material selected for this section.")
+
     # Build citation reference
     citation_ref = "\n".join([
         f"- {cit.full_text}" for cit in all_citations
     ]) if all_citations else "No citations available from source material."
 
-    prompt = f"""You are drafting a section of a legal brief. Generate content for the following section using ONLY the provided source material.
-
-SECTION TO DRAFT:
-Heading: {section.heading}
-Description: {section.description}
-
-MATTER CONTEXT:
-- Case: {matter.case_name}
-- Court: {matter.court}
-- Procedural Posture: {matter.procedural_posture.value}
-- Legal Issues: {', '.join(matter.legal_issues)}
-- Facts: {matter.fact_summary}
-
-SOURCE MATERIAL TO DRAW FROM:
-{chr(10).join(source_texts) if source_texts else 'No source material selected for this section.'}
+    prompt_parts.append(f"""
 
 AVAILABLE CITATIONS (USE ONLY THESE):
 {citation_ref}
 
-CRITICAL INSTRUCTIONS:
-1. NEVER invent or hallucinate citations. Only use citations listed above.
-2. If a statement needs a citation but none is available, write [CITATION NEEDED].
-3. Adapt the source material to this specific case and facts.
-4. Use [FACT PLACEHOLDER: description] where case-specific facts are needed.
-5. Maintain professional legal writing style.
-6. If this is a STATEMENT OF FACTS section, use mostly placeholders since facts are case-specific.
-
-WARNINGS TO CHECK:
-- If you reference client names from source material, note this for removal
-- If citations are more than 5 years old, note they should be verified
-- If using authority from a different jurisdiction, note it's persuasive only
-
-Write the section content now. After the content, provide a JSON block with:
-{{
-  "citations_used": ["full citation text", ...],
-  "citations_needed": ["description of what needs citation", ...],
-  "warnings": ["any safety warnings", ...],
-  "adaptations": [
-    {{"original": "original text excerpt", "adapted": "how you adapted it"}}
-  ]
-}}
-
-Section content:"""
+Section content:""")
+    prompt = "".join(prompt_parts)
 
-    response = client.messages.create(
+    params = dict(
         model="claude-sonnet-4-20250514",
         max_tokens=4000,
+        system=[{
+            "type": "text",
+            "text": SECTION_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"},
+        }],
         messages=[{"role": "user", "content": prompt}]
     )
+    return params, source_chunks, all_citations
 
-    response_text = response.content[0].text
 
+def _parse_section(
+    section: OutlineSection,
+    response_text: str,
+    source_chunks: list[RetrievalResult],
+    all_citations: list[Citation]
+) -> GeneratedSection:
+    """Build a GeneratedSection from Claude's response to a section request."""
     # Parse response - split content from JSON metadata
     content = response_text
     citations_used = []
@@ -312,36 +618,45 @@ Section content:"""
     adaptations = []
 
     # Try to extract JSON block at the end
-    json_match = re.search(r'\{[\s\S]*"citations_used"[\s\S]*\}', response_text)
-    if json_match:
-        try:
-            import json
-            metadata = json.loads(json_match.group())
-            content = response_text[:json_match.start()].strip()
-            citations_used = metadata.get("citations_used", [])
-            citations_needed = metadata.get("citations_needed", [])
-            warnings = metadata.get("warnings", [])
-            adaptations = metadata.get("adaptations", [])
-        except json.JSONDecodeError:
-            pass
+    metadata, metadata_start = _trailing_json_object(response_text, "citations_used")
+    if metadata is not None:
+        content = response_text[:metadata_start].strip()
+        citations_used = metadata.get("citations_used", [])
+        citations_needed = metadata.get("citations_needed", [])
+        warnings = metadata.get("warnings", [])
+        adaptations = metadata.get("adaptations", [])
 
     # Clean up markdown artifacts from the content
     content = _clean_markdown_artifacts(content)
 
-    # Map citation texts to Citation objects
+    # Map citation texts to Citation objects: exact text first, then text
+    # differing only in case or spacing, then text containing (or
+    # contained in) a citation's
+    by_text = {}
+    by_normalized_text = {}
+    for cit in all_citations:
+        by_text.setdefault(cit.full_text, cit)
+        by_normalized_text.setdefault(_normalize_citation_text(cit.full_text), cit)
+
     used_citation_objects = []
+    seen_ids = set()
     for cit_text in citations_used:
-        for cit in all_citations:
-            if cit.full_text in cit_text or cit_text in cit.full_text:
-                used_citation_objects.append(cit)
-                break
+        cit = by_text.get(cit_text) or by_normalized_text.get(_normalize_citation_text(cit_text))
+        if cit is None:
+            cit = next((
+                c for c in all_citations
+                if c.full_text in cit_text or cit_text in c.full_text
+            ), None)
+        if cit is not None and cit.id not in seen_ids:
+            seen_ids.add(cit.id)
+            used_citation_objects.append(cit)
 
     # Check for old citations
-    from datetime import datetime
-    current_year = datetime.now().year
-    for cit in used_citation_objects:
-        if cit.year and (current_year - cit.year) > 5:
-            warnings.append(f"Citation may be outdated (>5 years): {cit.full_text}")
+    if any(cit.year for cit in used_citation_objects):
+        cutoff_year = datetime.now().year - 5
+        for cit in used_citation_objects:
+            if cit.year and cit.year < cutoff_year:
+                warnings.append(f"Citation may be outdated (>5 years): {cit.full_text}")
 
     return GeneratedSection(
         section_id=section.id,
@@ -358,10 +673,84 @@ Section content:"""
     )
 
 
-def create_draft(
+async def generate_all_sections(
+    draft: DraftBrief,
+    store: BriefBankStore,
+    client: Optional[AsyncAnthropic] = None
+) -> list[GeneratedSection]:
+    """
+    Generate every section of a draft's outline.
+
+    Sections are independent, so their requests run concurrently and the
+    whole draft takes about as long as its slowest section. Returns the
+    sections in outline order.
+    """
+    client = client or get_anthropic_client()
+
+    return list(await asyncio.gather(*(
+        generate_section(section, draft.matter, store, client)
+        for section in draft.outline
+    )))
+
+
+async def generate_sections_batch(
+    draft: DraftBrief,
+    store: BriefBankStore,
+    client: Optional[AsyncAnthropic] = None,
+    poll_interval: float = BATCH_POLL_INTERVAL
+) -> list[GeneratedSection]:
+    """
+    Generate every section of a draft's outline as one Message Batch.
+
+    Batched requests cost half as much as interactive ones but can take
+    minutes or longer to finish, so this suits generating whole drafts in
+    the background; generate_all_sections is the interactive path.
+    Sections the batch fails to produce (errored, expired or canceled)
+    are generated directly. Returns the sections in outline order.
+    """
+    client = client or get_anthropic_client()
+    if not draft.outline:
+        return []
+
+    # Custom IDs are positions: outline section IDs can come from the
+    # client and need not fit the batch API's ID format
+    all_sources = await asyncio.gather(*(
+        _gather_sources(section, store) for section in draft.outline
+    ))
+    prepared = [
+        _prepare_section(section, draft.matter, sources)
+        for section, sources in zip(draft.outline, all_sources)
+    ]
+    batch = await client.messages.batches.create(requests=[
+        {"custom_id": f"section-{i}", "params": params}
+        for i, (params, _, _) in enumerate(prepared)
+    ])
+    while batch.processing_status != "ended":
+        await asyncio.sleep(poll_interval)
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    response_texts = {}
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            response_texts[entry.custom_id] = entry.result.message.content[0].text
+
+    async def finish(i: int, section: OutlineSection) -> GeneratedSection:
+        params, source_chunks, all_citations = prepared[i]
+        response_text = response_texts.get(f"section-{i}")
+        if response_text is None:
+            response = await _create_message(client, params)
+            response_text = response.content[0].text
+        return _parse_section(section, response_text, source_chunks, all_citations)
+
+    return list(await asyncio.gather(*(
+        finish(i, section) for i, section in enumerate(draft.outline)
+    )))
+
+
+async def create_draft(
     matter: NewMatterRequest,
     store: BriefBankStore,
-    client: Optional[Anthropic] = None
+    client: Optional[AsyncAnthropic] = None
 ) -> DraftBrief:
     """
     Create a new draft brief with outline.
@@ -374,18 +763,23 @@ def create_draft(
     # Build search query from matter
     query = f"{matter.procedural_posture.value} {' '.join(matter.legal_issues)} {matter.fact_summary}"
 
-    # Retrieve relevant chunks
-    search_results = store.search_chunks(
-        query=query,
-        jurisdiction=matter.jurisdiction,
-        procedural_posture=matter.procedural_posture.value,
-        limit=15
-    )
+    # Retrieve relevant chunks. Searching scores every chunk (and may
+    # embed the query), so it runs in a worker thread.
+    def search():
+        search_results = store.search_chunks(
+            query=query,
+            jurisdiction=matter.jurisdiction,
+            procedural_posture=matter.procedural_posture.value,
+            limit=15
+        )
+        return search_results, store.get_briefs({chunk.brief_id for chunk, _, _ in search_results})
+
+    search_results, briefs = await asyncio.to_thread(search)
 
     # Convert to RetrievalResult objects
     retrieved = []
     for chunk, score, reasons in search_results:
-        brief = store.get_brief(chunk.brief_id)
+        brief = briefs.get(chunk.brief_id)
         result = RetrievalResult(
             chunk=chunk,
             score=score,
@@ -396,7 +790,7 @@ def create_draft(
         retrieved.append(result)
 
     # Generate outline
-    outline = generate_outline(matter, retrieved, client)
+    outline = await generate_outline(matter, retrieved, client, store.embedding_client)
 
     # Create draft
     draft = DraftBrief(
@@ -409,12 +803,12 @@ def create_draft(
     return draft, retrieved
 
 
-def regenerate_section(
+async def regenerate_section(
     draft: DraftBrief,
     section_id: str,
     store: BriefBankStore,
     additional_sources: Optional[list[str]] = None,
-    client: Optional[Anthropic] = None
+    client: Optional[AsyncAnthropic] = None
 ) -> GeneratedSection:
     """
     Regenerate a single section, optionally with additional source chunks.
@@ -433,4 +827,4 @@ def regenerate_section(
     if additional_sources:
         section.source_chunks.extend(additional_sources)
 
-    return generate_section(section, draft.matter, store, client)
+    return await generate_section(section, draft.matter, store, client)
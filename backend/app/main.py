@@ -8,27 +8,42 @@ Provides REST API endpoints for:
 - DOCX export
 """
 
+import asyncio
+import hashlib
+import multiprocessing
 import os
 import uuid
 import shutil
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
+from urllib.parse import quote
 
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 from .models import (
     Brief, ArgumentChunk, NewMatterRequest, ProceduralPosture,
-    OutlineSection, GeneratedSection, DraftBrief, RetrievalResult
+    OutlineSection, GeneratedSection, DraftBrief, RetrievalResult, Citation
+)
+from .document_parser import (
+    parse_document, chunk_brief, create_parse_pool, parse_and_chunk_document,
+    shutdown_pdf_page_pool
 )
-from .document_parser import parse_document, chunk_brief
 from .embeddings import BriefBankStore
-from .generator import create_draft, generate_section, regenerate_section
-from .exporter import export_draft
+from .generator import (
+    create_draft, generate_section, generate_sections_batch, regenerate_section, stream_section
+)
+from .exporter import export_filename, write_brief_document
 
 
 # Initialize FastAPI app
@@ -47,6 +62,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (brief lists, search hits, drafts)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize store
 store = BriefBankStore()
 
@@ -54,8 +72,76 @@ store = BriefBankStore()
 UPLOAD_DIR = Path(__file__).parent.parent.parent / "data" / "briefs"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
-# In-memory storage for active drafts
-active_drafts: dict[str, tuple[DraftBrief, list[RetrievalResult]]] = {}
+# Active drafts are kept in memory, at most this many; a draft unused
+# for this many seconds is dropped
+MAX_ACTIVE_DRAFTS = 256
+DRAFT_IDLE_TTL = 60 * 60
+
+
+class DraftCache:
+    """
+    In-memory storage for active drafts, with their retrieved sources.
+
+    Bounded: beyond max_drafts the least recently used draft is dropped,
+    as is any draft unused for ttl seconds.
+    """
+
+    def __init__(self, max_drafts: int, ttl: float):
+        self.max_drafts = max_drafts
+        self.ttl = ttl
+        # Draft ID -> (last use, entry), least recently used first
+        self._drafts: OrderedDict[str, tuple[float, tuple[DraftBrief, list[RetrievalResult]]]] = OrderedDict()
+
+    def get(self, draft_id: str) -> Optional[tuple[DraftBrief, list[RetrievalResult]]]:
+        """The draft and its retrieved sources, or None if unknown or expired."""
+        self._expire()
+        item = self._drafts.get(draft_id)
+        if item is None:
+            return None
+        self._drafts[draft_id] = (time.monotonic(), item[1])
+        self._drafts.move_to_end(draft_id)
+        return item[1]
+
+    def put(self, draft_id: str, entry: tuple[DraftBrief, list[RetrievalResult]]):
+        """Store a draft and its retrieved sources."""
+        self._drafts[draft_id] = (time.monotonic(), entry)
+        self._drafts.move_to_end(draft_id)
+        self._expire()
+        while len(self._drafts) > self.max_drafts:
+            self._drafts.popitem(last=False)
+
+    def _expire(self):
+        """Drop drafts unused for longer than the TTL, oldest first."""
+        cutoff = time.monotonic() - self.ttl
+        while self._drafts and next(iter(self._drafts.values()))[0] < cutoff:
+            self._drafts.popitem(last=False)
+
+
+active_drafts = DraftCache(MAX_ACTIVE_DRAFTS, DRAFT_IDLE_TTL)
+
+
+def _get_active_draft(draft_id: str) -> tuple[DraftBrief, list[RetrievalResult]]:
+    """Get an active draft and its retrieved sources, or raise a 404."""
+    entry = active_drafts.get(draft_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Draft not found")
+    return entry
+
+
+# Whole-draft generations running in the background, by draft ID. Holding
+# the tasks keeps them from being garbage collected before they finish.
+_draft_generations: dict[str, asyncio.Task] = {}
+
+
+def _get_editable_draft(draft_id: str) -> tuple[DraftBrief, list[RetrievalResult]]:
+    """
+    Get an active draft and its retrieved sources, as _get_active_draft,
+    or raise a 409 while its whole-draft generation is running.
+    """
+    entry = _get_active_draft(draft_id)
+    if draft_id in _draft_generations:
+        raise HTTPException(status_code=409, detail="Draft is being generated")
+    return entry
 
 
 # ============ Health Check ============
@@ -68,7 +154,33 @@ async def health_check():
 
 # ============ Brief Ingestion ============
 
-@app.post("/api/briefs/upload")
+# JSON endpoints declare response models and build them with
+# model_construct, skipping validation: their data comes from the store or
+# the generator and was validated there. With the default response class,
+# FastAPI then serializes them straight to JSON bytes in pydantic-core,
+# rather than walking a dict with jsonable_encoder and json.dumps.
+# ProceduralPosture and SectionType members go into their str fields
+# as they are: both are str enums, so they serialize as their values.
+
+class BriefMetadata(BaseModel):
+    court: Optional[str]
+    jurisdiction: Optional[str]
+    procedural_posture: Optional[str]
+    case_name: Optional[str]
+    case_number: Optional[str]
+
+
+class UploadResult(BaseModel):
+    status: str
+    brief_id: str
+    title: Optional[str]
+    sections_count: int
+    chunks_count: int
+    citations_count: int
+    metadata: BriefMetadata
+
+
+@app.post("/api/briefs/upload", response_model=UploadResult)
 async def upload_brief(file: UploadFile = File(...)):
     """
     Upload and ingest a brief (DOCX or PDF).
@@ -86,37 +198,31 @@ async def upload_brief(file: UploadFile = File(...)):
             detail=f"Unsupported file type: {suffix}. Use .docx or .pdf"
         )
 
-    # Save uploaded file
+    # Save uploaded file. Copying, parsing and indexing all block, so they
+    # run in worker threads and other requests proceed meanwhile.
     file_path = UPLOAD_DIR / f"{uuid.uuid4()}{suffix}"
-    try:
+
+    def save():
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
+
+    try:
+        await asyncio.to_thread(save)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {e}")
 
     # Parse the document
-    try:
+    def ingest():
         brief = parse_document(file_path)
         chunks, citations = chunk_brief(brief)
 
         # Store in the brief bank
         store.add_brief(brief, chunks, citations)
+        return brief, chunks, citations
 
-        return {
-            "status": "success",
-            "brief_id": brief.id,
-            "title": brief.title,
-            "sections_count": len(brief.sections),
-            "chunks_count": len(chunks),
-            "citations_count": len(citations),
-            "metadata": {
-                "court": brief.court,
-                "jurisdiction": brief.jurisdiction,
-                "procedural_posture": brief.procedural_posture.value if brief.procedural_posture else None,
-                "case_name": brief.case_name,
-                "case_number": brief.case_number,
-            }
-        }
+    try:
+        brief, chunks, citations = await asyncio.to_thread(ingest)
+        return _upload_result(brief, chunks, citations)
 
     except Exception as e:
         # Clean up file on failure
@@ -125,29 +231,211 @@ async def upload_brief(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Failed to parse document: {e}")
 
 
-@app.get("/api/briefs")
+def _upload_result(
+    brief: Brief,
+    chunks: list[ArgumentChunk],
+    citations: list[Citation]
+) -> UploadResult:
+    """Describe an ingested brief for the upload endpoints."""
+    return UploadResult.model_construct(
+        status="success",
+        brief_id=brief.id,
+        title=brief.title,
+        sections_count=len(brief.sections),
+        chunks_count=len(chunks),
+        citations_count=len(citations),
+        metadata=BriefMetadata.model_construct(
+            court=brief.court,
+            jurisdiction=brief.jurisdiction,
+            procedural_posture=brief.procedural_posture,
+            case_name=brief.case_name,
+            case_number=brief.case_number,
+        )
+    )
+
+
+class BatchUploadItem(BaseModel):
+    filename: Optional[str]
+    result: Optional[UploadResult]
+    error: Optional[str]
+
+
+class BatchUploadResult(BaseModel):
+    results: list[BatchUploadItem]
+    succeeded: int
+    failed: int
+
+
+# Worker processes that batch uploads are parsed in, started on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """The process pool for batch uploads, started if need be."""
+    global _parse_pool
+    if _parse_pool is None:
+        # forkserver, so workers are not forked from this multi-threaded
+        # process (a lock held by another thread would stay held in them)
+        _parse_pool = create_parse_pool(mp_context=multiprocessing.get_context("forkserver"))
+    return _parse_pool
+
+
+@app.post("/api/briefs/upload_batch", response_model=BatchUploadResult)
+async def upload_briefs(files: list[UploadFile] = File(...)):
+    """
+    Upload and ingest several briefs (DOCX or PDF) at once.
+
+    The documents are parsed in parallel worker processes, then added to
+    the brief bank together. Each file gets its own result, so one that
+    can't be read doesn't fail the rest.
+    """
+    global _parse_pool
+    errors: dict[int, str] = {}
+    file_paths: dict[int, Path] = {}
+
+    # Validate file types
+    for i, file in enumerate(files):
+        suffix = Path(file.filename or "").suffix.lower()
+        if not file.filename:
+            errors[i] = "No filename provided"
+        elif suffix not in [".docx", ".pdf"]:
+            errors[i] = f"Unsupported file type: {suffix}. Use .docx or .pdf"
+        else:
+            file_paths[i] = UPLOAD_DIR / f"{uuid.uuid4()}{suffix}"
+
+    # Save uploaded files
+    def save() -> dict[int, str]:
+        failures = {}
+        for i, file_path in file_paths.items():
+            try:
+                with open(file_path, "wb") as buffer:
+                    shutil.copyfileobj(files[i].file, buffer)
+            except Exception as e:
+                failures[i] = f"Failed to save file: {e}"
+        return failures
+
+    errors.update(await asyncio.to_thread(save))
+    for i in errors:
+        file_paths.pop(i, None)
+
+    # Parse the documents, one per worker process at a time
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool()
+    outcomes = await asyncio.gather(*(
+        loop.run_in_executor(pool, parse_and_chunk_document, file_path)
+        for file_path in file_paths.values()
+    ), return_exceptions=True)
+
+    parsed = {}
+    for (i, file_path), outcome in zip(file_paths.items(), outcomes):
+        if isinstance(outcome, BrokenProcessPool):
+            # A worker died; start a fresh pool for the next batch
+            if _parse_pool is pool:
+                _parse_pool = None
+        if isinstance(outcome, Exception):
+            errors[i] = f"Failed to parse document: {outcome}"
+            file_path.unlink(missing_ok=True)
+        else:
+            parsed[i] = outcome
+
+    # Store in the brief bank
+    try:
+        await asyncio.to_thread(store.add_briefs, list(parsed.values()))
+    except Exception as e:
+        for i in parsed:
+            errors[i] = f"Failed to store brief: {e}"
+            file_paths[i].unlink(missing_ok=True)
+        parsed = {}
+
+    return BatchUploadResult.model_construct(
+        results=[
+            BatchUploadItem.model_construct(
+                filename=file.filename,
+                result=_upload_result(*parsed[i]) if i in parsed else None,
+                error=errors.get(i),
+            )
+            for i, file in enumerate(files)
+        ],
+        succeeded=len(parsed),
+        failed=len(errors)
+    )
+
+
+
+class BriefSummary(BaseModel):
+    id: str
+    title: Optional[str]
+    filename: str
+    court: Optional[str]
+    jurisdiction: Optional[str]
+    procedural_posture: Optional[str]
+    case_name: Optional[str]
+    ingested_at: Optional[datetime]
+
+
+class BriefList(BaseModel):
+    briefs: list[BriefSummary]
+    total: int
+
+
+@app.get("/api/briefs", response_model=BriefList)
 async def list_briefs():
     """List all briefs in the brief bank."""
     briefs = store.get_all_briefs()
-    return {
-        "briefs": [
-            {
-                "id": b.id,
-                "title": b.title,
-                "filename": b.filename,
-                "court": b.court,
-                "jurisdiction": b.jurisdiction,
-                "procedural_posture": b.procedural_posture.value if b.procedural_posture else None,
-                "case_name": b.case_name,
-                "ingested_at": b.ingested_at.isoformat() if b.ingested_at else None,
-            }
+    return BriefList.model_construct(
+        briefs=[
+            BriefSummary.model_construct(
+                id=b.id,
+                title=b.title,
+                filename=b.filename,
+                court=b.court,
+                jurisdiction=b.jurisdiction,
+                procedural_posture=b.procedural_posture,
+                case_name=b.case_name,
+                ingested_at=b.ingested_at,
+            )
             for b in briefs
         ],
-        "total": len(briefs)
-    }
+        total=len(briefs)
+    )
+
 
+class BriefDetail(BaseModel):
+    id: str
+    title: Optional[str]
+    filename: str
+    court: Optional[str]
+    jurisdiction: Optional[str]
+    procedural_posture: Optional[str]
+    case_name: Optional[str]
+    case_number: Optional[str]
+    legal_issues: list[str]
+    outcome: Optional[str]
+    ingested_at: Optional[datetime]
 
-@app.get("/api/briefs/{brief_id}")
+
+class SectionPreview(BaseModel):
+    id: str
+    type: str
+    title: Optional[str]
+    content_preview: str
+
+
+class ChunkPreview(BaseModel):
+    id: str
+    heading: Optional[str]
+    type: str
+    content_preview: str
+    citation_count: int
+
+
+class BriefView(BaseModel):
+    brief: BriefDetail
+    sections: list[SectionPreview]
+    chunks: list[ChunkPreview]
+
+
+@app.get("/api/briefs/{brief_id}", response_model=BriefView)
 async def get_brief(brief_id: str):
     """Get details for a specific brief."""
     brief = store.get_brief(brief_id)
@@ -155,46 +443,50 @@ async def get_brief(brief_id: str):
         raise HTTPException(status_code=404, detail="Brief not found")
 
     # Get chunks for this brief
-    chunk_ids = store.store.chunks_by_brief.get(brief_id, [])
-    chunks = [store.get_chunk(cid) for cid in chunk_ids]
-
-    return {
-        "brief": {
-            "id": brief.id,
-            "title": brief.title,
-            "filename": brief.filename,
-            "court": brief.court,
-            "jurisdiction": brief.jurisdiction,
-            "procedural_posture": brief.procedural_posture.value if brief.procedural_posture else None,
-            "case_name": brief.case_name,
-            "case_number": brief.case_number,
-            "legal_issues": brief.legal_issues,
-            "outcome": brief.outcome,
-            "ingested_at": brief.ingested_at.isoformat() if brief.ingested_at else None,
-        },
-        "sections": [
-            {
-                "id": s.id,
-                "type": s.section_type.value,
-                "title": s.title,
-                "content_preview": s.content[:500] + "..." if len(s.content) > 500 else s.content,
-            }
+    chunks = store.get_brief_chunks(brief_id)
+
+    return BriefView.model_construct(
+        brief=BriefDetail.model_construct(
+            id=brief.id,
+            title=brief.title,
+            filename=brief.filename,
+            court=brief.court,
+            jurisdiction=brief.jurisdiction,
+            procedural_posture=brief.procedural_posture,
+            case_name=brief.case_name,
+            case_number=brief.case_number,
+            legal_issues=brief.legal_issues,
+            outcome=brief.outcome,
+            ingested_at=brief.ingested_at,
+        ),
+        sections=[
+            SectionPreview.model_construct(
+                id=s.id,
+                type=s.section_type,
+                title=s.title,
+                content_preview=s.content[:500] + "..." if len(s.content) > 500 else s.content,
+            )
             for s in brief.sections
         ],
-        "chunks": [
-            {
-                "id": c.id,
-                "heading": c.heading,
-                "type": c.section_type.value,
-                "content_preview": c.content[:300] + "..." if len(c.content) > 300 else c.content,
-                "citation_count": len(c.citations),
-            }
-            for c in chunks if c
+        chunks=[
+            ChunkPreview.model_construct(
+                id=c.id,
+                heading=c.heading,
+                type=c.section_type,
+                content_preview=c.content[:300] + "..." if len(c.content) > 300 else c.content,
+                citation_count=len(c.citations),
+            )
+            for c in chunks
         ]
-    }
+    )
+
+
+class BriefDeleted(BaseModel):
+    status: str
+    brief_id: str
 
 
-@app.delete("/api/briefs/{brief_id}")
+@app.delete("/api/briefs/{brief_id}", response_model=BriefDeleted)
 async def delete_brief(brief_id: str):
     """Delete a brief from the brief bank."""
     brief = store.get_brief(brief_id)
@@ -202,7 +494,7 @@ async def delete_brief(brief_id: str):
         raise HTTPException(status_code=404, detail="Brief not found")
 
     store.delete_brief(brief_id)
-    return {"status": "deleted", "brief_id": brief_id}
+    return BriefDeleted.model_construct(status="deleted", brief_id=brief_id)
 
 
 # ============ Search & Retrieval ============
@@ -214,43 +506,93 @@ class SearchRequest(BaseModel):
     limit: int = 10
 
 
-@app.post("/api/search")
+class ChunkHit(BaseModel):
+    chunk_id: str
+    brief_id: str
+    heading: Optional[str]
+    content: str
+    section_type: str
+    court: Optional[str]
+    jurisdiction: Optional[str]
+    score: float
+    match_reasons: list[str]
+    source_brief: Optional[str]
+
+
+class SearchResponse(BaseModel):
+    results: list[ChunkHit]
+    total: int
+
+
+@app.post("/api/search", response_model=SearchResponse)
 async def search_chunks(request: SearchRequest):
     """
     Search the brief bank for relevant chunks.
 
     Returns chunks ranked by relevance with match explanations.
     """
-    results = store.search_chunks(
-        query=request.query,
-        jurisdiction=request.jurisdiction,
-        procedural_posture=request.procedural_posture,
-        limit=request.limit
-    )
-
-    return {
-        "results": [
-            {
-                "chunk_id": chunk.id,
-                "brief_id": chunk.brief_id,
-                "heading": chunk.heading,
-                "content": chunk.content,
-                "section_type": chunk.section_type.value,
-                "court": chunk.court,
-                "jurisdiction": chunk.jurisdiction,
-                "score": score,
-                "match_reasons": reasons,
-                "source_brief": store.get_brief(chunk.brief_id).title if store.get_brief(chunk.brief_id) else None,
-            }
+    # Searching scores every chunk and may embed the query over the
+    # network, so it runs in a worker thread, along with looking up each
+    # source brief once however many hits it has
+    def search():
+        results = store.search_chunks(
+            query=request.query,
+            jurisdiction=request.jurisdiction,
+            procedural_posture=request.procedural_posture,
+            limit=request.limit
+        )
+        return results, store.get_briefs({chunk.brief_id for chunk, _, _ in results})
+
+    results, briefs = await asyncio.to_thread(search)
+    brief_titles = {brief_id: brief.title for brief_id, brief in briefs.items()}
+
+    return SearchResponse.model_construct(
+        results=[
+            ChunkHit.model_construct(
+                chunk_id=chunk.id,
+                brief_id=chunk.brief_id,
+                heading=chunk.heading,
+                content=chunk.content,
+                section_type=chunk.section_type,
+                court=chunk.court,
+                jurisdiction=chunk.jurisdiction,
+                score=score,
+                match_reasons=reasons,
+                source_brief=brief_titles.get(chunk.brief_id),
+            )
             for chunk, score, reasons in results
         ],
-        "total": len(results)
-    }
+        total=len(results)
+    )
 
 
 # ============ Draft Generation ============
 
-@app.post("/api/drafts/create")
+class OutlineItem(BaseModel):
+    id: str
+    heading: str
+    description: str
+    source_count: int
+    order: int
+
+
+class SourcePreview(BaseModel):
+    chunk_id: str
+    heading: Optional[str]
+    content_preview: str
+    score: float
+    match_reasons: list[str]
+    source_brief: Optional[str]
+
+
+class DraftCreated(BaseModel):
+    draft_id: str
+    status: str
+    outline: list[OutlineItem]
+    retrieved_sources: list[SourcePreview]
+
+
+@app.post("/api/drafts/create", response_model=DraftCreated)
 async def create_new_draft(matter: NewMatterRequest):
     """
     Create a new draft brief.
@@ -258,36 +600,36 @@ async def create_new_draft(matter: NewMatterRequest):
     Returns an outline based on retrieved source material.
     """
     try:
-        draft, retrieved = create_draft(matter, store)
+        draft, retrieved = await create_draft(matter, store)
 
         # Store for later use
-        active_drafts[draft.id] = (draft, retrieved)
-
-        return {
-            "draft_id": draft.id,
-            "status": draft.status,
-            "outline": [
-                {
-                    "id": s.id,
-                    "heading": s.heading,
-                    "description": s.description,
-                    "source_count": len(s.source_chunks),
-                    "order": s.order,
-                }
+        active_drafts.put(draft.id, (draft, retrieved))
+
+        return DraftCreated.model_construct(
+            draft_id=draft.id,
+            status=draft.status,
+            outline=[
+                OutlineItem.model_construct(
+                    id=s.id,
+                    heading=s.heading,
+                    description=s.description,
+                    source_count=len(s.source_chunks),
+                    order=s.order,
+                )
                 for s in draft.outline
             ],
-            "retrieved_sources": [
-                {
-                    "chunk_id": r.chunk.id,
-                    "heading": r.chunk.heading,
-                    "content_preview": r.chunk.content[:300],
-                    "score": r.score,
-                    "match_reasons": r.match_reasons,
-                    "source_brief": r.source_brief_title,
-                }
+            retrieved_sources=[
+                SourcePreview.model_construct(
+                    chunk_id=r.chunk.id,
+                    heading=r.chunk.heading,
+                    content_preview=r.chunk.content[:300],
+                    score=r.score,
+                    match_reasons=r.match_reasons,
+                    source_brief=r.source_brief_title,
+                )
                 for r in retrieved[:10]
             ]
-        }
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create draft: {e}")
 
@@ -296,13 +638,15 @@ class UpdateOutlineRequest(BaseModel):
     sections: list[dict]  # [{id, heading, description, source_chunks, order}]
 
 
-@app.put("/api/drafts/{draft_id}/outline")
+class OutlineUpdated(BaseModel):
+    status: str
+    outline_sections: int
+
+
+@app.put("/api/drafts/{draft_id}/outline", response_model=OutlineUpdated)
 async def update_outline(draft_id: str, request: UpdateOutlineRequest):
     """Update the outline for a draft."""
-    if draft_id not in active_drafts:
-        raise HTTPException(status_code=404, detail="Draft not found")
-
-    draft, retrieved = active_drafts[draft_id]
+    draft, retrieved = _get_editable_draft(draft_id)
 
     # Update outline sections
     new_outline = []
@@ -319,16 +663,30 @@ async def update_outline(draft_id: str, request: UpdateOutlineRequest):
     draft.outline = sorted(new_outline, key=lambda s: s.order)
     draft.updated_at = datetime.now()
 
-    return {"status": "updated", "outline_sections": len(draft.outline)}
+    return OutlineUpdated.model_construct(status="updated", outline_sections=len(draft.outline))
 
 
-@app.post("/api/drafts/{draft_id}/generate/{section_id}")
+class SourceExcerpt(BaseModel):
+    chunk_id: str
+    heading: Optional[str]
+    content_preview: str
+
+
+class SectionResult(BaseModel):
+    section_id: str
+    heading: str
+    content: str
+    citations_used: list[str]
+    citations_needed: list[str]
+    warnings: list[str]
+    sources: list[SourceExcerpt]
+    adaptations: list[dict]
+
+
+@app.post("/api/drafts/{draft_id}/generate/{section_id}", response_model=SectionResult)
 async def generate_draft_section(draft_id: str, section_id: str):
     """Generate content for a specific section."""
-    if draft_id not in active_drafts:
-        raise HTTPException(status_code=404, detail="Draft not found")
-
-    draft, _ = active_drafts[draft_id]
+    draft, _ = _get_editable_draft(draft_id)
 
     # Find the section
     section = None
@@ -341,57 +699,146 @@ async def generate_draft_section(draft_id: str, section_id: str):
         raise HTTPException(status_code=404, detail="Section not found")
 
     try:
-        generated = generate_section(section, draft.matter, store)
-
-        # Update draft
-        # Remove existing version if regenerating
-        draft.sections = [s for s in draft.sections if s.section_id != section_id]
-        draft.sections.append(generated)
-        draft.sections.sort(key=lambda s: next(
-            (o.order for o in draft.outline if o.id == s.section_id), 0
-        ))
-        draft.updated_at = datetime.now()
-
-        return {
-            "section_id": generated.section_id,
-            "heading": generated.heading,
-            "content": generated.content,
-            "citations_used": [c.full_text for c in generated.citations_used],
-            "citations_needed": generated.citations_needed,
-            "warnings": generated.warnings,
-            "sources": [
-                {
-                    "chunk_id": src.chunk.id,
-                    "heading": src.chunk.heading,
-                    "content_preview": src.chunk.content[:200],
-                }
+        generated = await generate_section(section, draft.matter, store)
+        _save_generated_section(draft, generated)
+
+        return SectionResult.model_construct(
+            section_id=generated.section_id,
+            heading=generated.heading,
+            content=generated.content,
+            citations_used=[c.full_text for c in generated.citations_used],
+            citations_needed=generated.citations_needed,
+            warnings=generated.warnings,
+            sources=[
+                SourceExcerpt.model_construct(
+                    chunk_id=src.chunk.id,
+                    heading=src.chunk.heading,
+                    content_preview=src.chunk.content[:200],
+                )
                 for src in generated.source_chunks
             ],
-            "adaptations": generated.original_sources,
-        }
+            adaptations=generated.original_sources,
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Generation failed: {e}")
 
 
+@app.post("/api/drafts/{draft_id}/generate/{section_id}/stream")
+async def stream_draft_section(draft_id: str, section_id: str):
+    """
+    Generate content for a specific section, streaming its text as it is written.
+
+    The response is a plain-text preview of the section. Once it ends, the
+    finished section is saved to the draft, as by generate_draft_section,
+    and can be fetched with get_draft.
+    """
+    draft, _ = _get_editable_draft(draft_id)
+
+    # Find the section
+    section = None
+    for s in draft.outline:
+        if s.id == section_id:
+            section = s
+            break
+
+    if not section:
+        raise HTTPException(status_code=404, detail="Section not found")
+
+    async def preview():
+        async for piece in stream_section(section, draft.matter, store):
+            if isinstance(piece, GeneratedSection):
+                _save_generated_section(draft, piece)
+            else:
+                yield piece
+
+    return StreamingResponse(preview(), media_type="text/plain; charset=utf-8")
+
+
+class DraftGenerationStarted(BaseModel):
+    draft_id: str
+    status: str
+    outline_sections: int
+
+
+@app.post(
+    "/api/drafts/{draft_id}/generate_all",
+    response_model=DraftGenerationStarted,
+    status_code=202
+)
+async def generate_whole_draft(draft_id: str):
+    """
+    Generate every section of a draft's outline in the background.
+
+    The sections go to Claude as one Message Batch, at half the cost of
+    generating them one by one, but a batch can take minutes. The draft's
+    status is "drafting" until the sections are saved to it, then
+    "review"; poll get_draft for them. Until then the outline and its
+    sections can't be changed (409).
+    """
+    draft, retrieved = _get_editable_draft(draft_id)
+    if not draft.outline:
+        raise HTTPException(status_code=400, detail="Draft has no outline")
+
+    previous_status = draft.status
+    draft.status = "drafting"
+
+    async def generate():
+        try:
+            for generated in await generate_sections_batch(draft, store):
+                _save_generated_section(draft, generated)
+            draft.status = "review"
+            # The batch can outlast the draft's idle TTL, or see it
+            # evicted, so put it back for the caller to fetch
+            active_drafts.put(draft_id, (draft, retrieved))
+        except Exception as e:
+            draft.status = previous_status
+            print(f"⚠ Generating draft {draft_id} failed: {e}")
+        finally:
+            del _draft_generations[draft_id]
+
+    _draft_generations[draft_id] = asyncio.create_task(generate())
+
+    return DraftGenerationStarted.model_construct(
+        draft_id=draft_id, status=draft.status, outline_sections=len(draft.outline)
+    )
+
+
+def _save_generated_section(draft: DraftBrief, generated: GeneratedSection):
+    """Put a generated section into its draft, replacing any earlier version."""
+    # Remove existing version if regenerating
+    draft.sections = [s for s in draft.sections if s.section_id != generated.section_id]
+    draft.sections.append(generated)
+    # Sections follow their outline order; one not in the outline sorts
+    # as 0. Built in reverse so the first outline entry wins if IDs repeat.
+    order_by_id = {o.id: o.order for o in reversed(draft.outline)}
+    draft.sections.sort(key=lambda s: order_by_id.get(s.section_id, 0))
+    draft.updated_at = datetime.now()
+
+
 class RegenerateRequest(BaseModel):
     additional_sources: Optional[list[str]] = None
 
 
-@app.post("/api/drafts/{draft_id}/regenerate/{section_id}")
+class RegeneratedSection(BaseModel):
+    section_id: str
+    heading: str
+    content: str
+    citations_needed: list[str]
+    warnings: list[str]
+
+
+@app.post("/api/drafts/{draft_id}/regenerate/{section_id}", response_model=RegeneratedSection)
 async def regenerate_draft_section(
     draft_id: str,
     section_id: str,
     request: RegenerateRequest
 ):
     """Regenerate a section with optional additional sources."""
-    if draft_id not in active_drafts:
-        raise HTTPException(status_code=404, detail="Draft not found")
-
-    draft, _ = active_drafts[draft_id]
+    draft, _ = _get_editable_draft(draft_id)
 
     try:
-        generated = regenerate_section(
+        generated = await regenerate_section(
             draft,
             section_id,
             store,
@@ -403,59 +850,90 @@ async def regenerate_draft_section(
         draft.sections.append(generated)
         draft.updated_at = datetime.now()
 
-        return {
-            "section_id": generated.section_id,
-            "heading": generated.heading,
-            "content": generated.content,
-            "citations_needed": generated.citations_needed,
-            "warnings": generated.warnings,
-        }
+        return RegeneratedSection.model_construct(
+            section_id=generated.section_id,
+            heading=generated.heading,
+            content=generated.content,
+            citations_needed=generated.citations_needed,
+            warnings=generated.warnings,
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Regeneration failed: {e}")
 
 
-@app.get("/api/drafts/{draft_id}")
+class MatterSummary(BaseModel):
+    case_name: str
+    court: str
+    jurisdiction: str
+    procedural_posture: str
+    legal_issues: list[str]
+
+
+class OutlineStatus(BaseModel):
+    id: str
+    heading: str
+    description: str
+    order: int
+    generated: bool
+
+
+class SectionView(BaseModel):
+    section_id: str
+    heading: str
+    content: str
+    warnings: list[str]
+    citations_needed: list[str]
+
+
+class DraftView(BaseModel):
+    draft_id: str
+    status: str
+    matter: MatterSummary
+    outline: list[OutlineStatus]
+    sections: list[SectionView]
+    created_at: datetime
+    updated_at: datetime
+
+
+@app.get("/api/drafts/{draft_id}", response_model=DraftView)
 async def get_draft(draft_id: str):
     """Get the current state of a draft."""
-    if draft_id not in active_drafts:
-        raise HTTPException(status_code=404, detail="Draft not found")
-
-    draft, retrieved = active_drafts[draft_id]
-
-    return {
-        "draft_id": draft.id,
-        "status": draft.status,
-        "matter": {
-            "case_name": draft.matter.case_name,
-            "court": draft.matter.court,
-            "jurisdiction": draft.matter.jurisdiction,
-            "procedural_posture": draft.matter.procedural_posture.value,
-            "legal_issues": draft.matter.legal_issues,
-        },
-        "outline": [
-            {
-                "id": s.id,
-                "heading": s.heading,
-                "description": s.description,
-                "order": s.order,
-                "generated": any(gs.section_id == s.id for gs in draft.sections),
-            }
+    draft, retrieved = _get_active_draft(draft_id)
+
+    return DraftView.model_construct(
+        draft_id=draft.id,
+        status=draft.status,
+        matter=MatterSummary.model_construct(
+            case_name=draft.matter.case_name,
+            court=draft.matter.court,
+            jurisdiction=draft.matter.jurisdiction,
+            procedural_posture=draft.matter.procedural_posture,
+            legal_issues=draft.matter.legal_issues,
+        ),
+        outline=[
+            OutlineStatus.model_construct(
+                id=s.id,
+                heading=s.heading,
+                description=s.description,
+                order=s.order,
+                generated=any(gs.section_id == s.id for gs in draft.sections),
+            )
             for s in draft.outline
         ],
-        "sections": [
-            {
-                "section_id": s.section_id,
-                "heading": s.heading,
-                "content": s.content,
-                "warnings": s.warnings,
-                "citations_needed": s.citations_needed,
-            }
+        sections=[
+            SectionView.model_construct(
+                section_id=s.section_id,
+                heading=s.heading,
+                content=s.content,
+                warnings=s.warnings,
+                citations_needed=s.citations_needed,
+            )
             for s in draft.sections
         ],
-        "created_at": draft.created_at.isoformat(),
-        "updated_at": draft.updated_at.isoformat(),
-    }
+        created_at=draft.created_at,
+        updated_at=draft.updated_at,
+    )
 
 
 # ============ Export ============
@@ -463,10 +941,7 @@ async def get_draft(draft_id: str):
 @app.post("/api/drafts/{draft_id}/export")
 async def export_draft_to_docx(draft_id: str):
     """Export the draft to a DOCX file."""
-    if draft_id not in active_drafts:
-        raise HTTPException(status_code=404, detail="Draft not found")
-
-    draft, _ = active_drafts[draft_id]
+    draft, _ = _get_active_draft(draft_id)
 
     if not draft.sections:
         raise HTTPException(
@@ -474,13 +949,27 @@ async def export_draft_to_docx(draft_id: str):
             detail="No sections generated yet. Generate sections before exporting."
         )
 
-    try:
-        output_path = export_draft(draft)
+    # The document is built in memory, in a worker thread, and sent
+    # without a round trip through the exports directory
+    def build() -> bytes:
+        buffer = BytesIO()
+        write_brief_document(draft, buffer)
+        return buffer.getvalue()
 
-        return FileResponse(
-            path=output_path,
-            filename=output_path.name,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    try:
+        content = await asyncio.to_thread(build)
+
+        # Same Content-Disposition as FileResponse would send
+        filename = export_filename(draft)
+        quoted = quote(filename)
+        disposition = (
+            f'attachment; filename="{filename}"' if quoted == filename
+            else f"attachment; filename*=utf-8''{quoted}"
+        )
+        return Response(
+            content=content,
+            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            headers={"Content-Disposition": disposition}
         )
 
     except Exception as e:
@@ -503,13 +992,46 @@ if STATIC_DIR.exists():
             raise HTTPException(status_code=404)
 
         # Serve index.html for SPA routing
-        index_path = STATIC_DIR / "index.html"
-        if index_path.exists():
-            return HTMLResponse(content=index_path.read_text())
-        raise HTTPException(status_code=404)
+        index = _index_html()
+        if index is None:
+            raise HTTPException(status_code=404)
 
+        # Browsers revalidate (no-cache) and get a 304 while it is unchanged
+        content, etag = index
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=content, headers=headers)
 
-# ============ Startup ============
+
+# index.html's bytes and ETag, keyed by the file's (mtime, size)
+_index_cache: dict[tuple[int, int], tuple[bytes, str]] = {}
+
+
+def _index_html() -> Optional[tuple[bytes, str]]:
+    """
+    The SPA's index.html and its ETag, or None if there is none.
+
+    The file is reread only when its modification time or size changes,
+    so each request costs a stat rather than a read and decode.
+    """
+    index_path = STATIC_DIR / "index.html"
+    try:
+        stat = index_path.stat()
+    except FileNotFoundError:
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _index_cache.get(key)
+    if cached is None:
+        content = index_path.read_bytes()
+        etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+        _index_cache.clear()
+        cached = _index_cache[key] = (content, etag)
+    return cached
+
+
+# ============ Startup & Shutdown ============
 
 @app.on_event("startup")
 async def startup():
@@ -528,3 +1050,16 @@ async def startup():
         print(f"✓ Serving static files from {STATIC_DIR}")
     else:
         print("ℹ No static directory - running in API-only mode")
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """
+    Stop the batch upload and PDF page worker processes, if started, and
+    any whole-draft generations still running.
+    """
+    for task in list(_draft_generations.values()):
+        task.cancel()
+    if _parse_pool is not None:
+        _parse_pool.shutdown()
+    shutdown_pdf_page_pool()
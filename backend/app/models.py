@@ -150,8 +150,8 @@ class BriefStore(BaseModel):
 
     # Index for faster lookups
     chunks_by_brief: dict[str, list[str]] = Field(default_factory=dict)
-    chunks_by_issue: dict[str, list[str]] = Field(default_factory=dict)
-    chunks_by_jurisdiction: dict[str, list[str]] = Field(default_factory=dict)
+    chunks_by_issue: dict[str, set[str]] = Field(default_factory=dict)
+    chunks_by_jurisdiction: dict[str, set[str]] = Field(default_factory=dict)
 
 
 # Request/Response models for API
@@ -2,65 +2,156 @@
 Generate synthetic sample briefs for testing the Brief Bank tool.
 """
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
+
 from docx import Document
 from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 from pathlib import Path
 
+OUTPUT_DIR = Path(__file__).resolve().parent
+
+DOCUMENT_PART = 'word/document.xml'
+# Every package entry gets the same timestamp, so regenerating the samples
+# reproduces the committed files byte for byte
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+MARGIN = Inches(1)
+FIRST_LINE_INDENT = Inches(0.5)
+
+# Double-spaced (480 = 2.0 * 240) body paragraph with a first-line indent
+BODY_PARAGRAPH_XML = (
+    '<w:p><w:pPr><w:spacing w:line="480" w:lineRule="auto"/>'
+    f'<w:ind w:firstLine="{FIRST_LINE_INDENT.twips}"/></w:pPr>'
+    '{}</w:p>'
+)
+# Centered paragraph, used with a bold run for the caption and headings
+CENTERED_PARAGRAPH_XML = '<w:p><w:pPr><w:jc w:val="center"/></w:pPr>{}</w:p>'
+BOLD_RPR_XML = '<w:rPr><w:b/></w:rPr>'
+RUN_BREAK_RE = re.compile(r'([\t\r\n])')
+
+# Empty paragraph with a bottom border: Word's native horizontal rule
+HORIZONTAL_RULE_XML = (
+    '<w:p><w:pPr><w:pBdr>'
+    '<w:bottom w:val="single" w:sz="6" w:space="1" w:color="auto"/>'
+    '</w:pBdr></w:pPr></w:p>'
+)
+
+
+def _run_xml(text: str, bold: bool = False) -> str:
+    """Build the run XML for text, the way add_paragraph(text) does."""
+    if not text:
+        return ''
+    parts = ['<w:r>' + BOLD_RPR_XML if bold else '<w:r>']
+    for piece in RUN_BREAK_RE.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\r', '\n'):
+            parts.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ''
+            parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    parts.append('</w:r>')
+    return ''.join(parts)
+
+
+def _heading_xml(text: str) -> str:
+    """Build a centered, bold paragraph."""
+    return CENTERED_PARAGRAPH_XML.format(_run_xml(text, bold=True))
+
+
+def _section_xml(section: dict) -> str:
+    """Build a section's heading, body paragraphs and trailing blank line.
+
+    Produces the same XML python-docx would serialize for the equivalent
+    add_paragraph() calls and paragraph/run formatting.
+    """
+    parts = [_heading_xml(section['title'])]
+    parts.extend(BODY_PARAGRAPH_XML.format(_run_xml(text)) for text in section['paragraphs'])
+    parts.append('<w:p/>')
+    return ''.join(parts)
+
+
+def _zip_info(name: str) -> ZipInfo:
+    """Zip entry metadata for a package part, fixed so output is reproducible."""
+    info = ZipInfo(name, date_time=ZIP_DATE_TIME)
+    info.compress_type = ZIP_DEFLATED
+    info.external_attr = 0o600 << 16
+    return info
 
-def create_brief(filename: str, content: dict):
-    """Create a DOCX brief from content dictionary."""
-    doc = Document()
 
-    # Set margins
+@lru_cache(maxsize=None)
+def _package_template() -> tuple[tuple[tuple[str, bytes], ...], str, str]:
+    """Build the package every brief shares, once per process.
+
+    Returns the parts of an empty, margin-adjusted python-docx document,
+    in package order, plus its main document XML split at the point
+    where body paragraphs go (just before the final w:sectPr).
+    """
+    doc = Document()
     for section in doc.sections:
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
-        section.left_margin = Inches(1)
-        section.right_margin = Inches(1)
+        section.top_margin = MARGIN
+        section.bottom_margin = MARGIN
+        section.left_margin = MARGIN
+        section.right_margin = MARGIN
 
-    # Caption
-    caption = doc.add_paragraph()
-    caption.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = caption.add_run(content['court'].upper())
-    run.bold = True
+    buffer = BytesIO()
+    doc.save(buffer)
+    with ZipFile(buffer) as package:
+        parts = tuple((info.filename, package.read(info)) for info in package.infolist())
 
-    doc.add_paragraph()
+    document_xml = dict(parts)[DOCUMENT_PART].decode('utf-8')
+    head, sect_pr, tail = document_xml.rpartition('<w:sectPr')
+    return parts, head, sect_pr + tail
 
-    # Case name
-    case_para = doc.add_paragraph()
-    case_para.add_run(content['case_name']).bold = True
-    case_para.add_run(f"\n\nCase No. {content['case_number']}")
-    case_para.add_run(f"\n\n{content['document_title'].upper()}")
 
-    doc.add_paragraph("_" * 50)
-    doc.add_paragraph()
+def create_brief(filename: str, content: dict) -> Path:
+    """Create a DOCX brief from content dictionary. Returns its path.
 
-    # Sections
-    for section in content['sections']:
-        # Section heading
-        heading = doc.add_paragraph()
-        heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = heading.add_run(section['title'])
-        run.bold = True
+    The body is rendered straight to XML and written into a copy of the
+    template package, so no python-docx Document is built per brief.
+    """
+    parts, head, tail = _package_template()
 
-        # Section content
-        for para_text in section['paragraphs']:
-            para = doc.add_paragraph(para_text)
-            para.paragraph_format.line_spacing = 2.0
-            para.paragraph_format.first_line_indent = Inches(0.5)
+    # Caption, then the case name, number and document title above a rule
+    case_runs = (
+        _run_xml(content['case_name'], bold=True)
+        + _run_xml(f"\n\nCase No. {content['case_number']}")
+        + _run_xml(f"\n\n{content['document_title'].upper()}")
+    )
+    body = [
+        _heading_xml(content['court'].upper()),
+        '<w:p/>',
+        f'<w:p>{case_runs}</w:p>',
+        HORIZONTAL_RULE_XML,
+        '<w:p/>',
+    ]
 
-        doc.add_paragraph()
+    # Sections
+    body.extend(_section_xml(section) for section in content['sections'])
 
     # Save
-    output_path = Path(__file__).parent / filename
-    doc.save(output_path)
-    print(f"Created: {output_path}")
+    output_path = OUTPUT_DIR / filename
+    with ZipFile(output_path, 'w', compression=ZIP_DEFLATED) as package:
+        for name, data in parts:
+            if name == DOCUMENT_PART:
+                data = ''.join([head, *body, tail]).encode('utf-8')
+            package.writestr(_zip_info(name), data)
+    return output_path
+
+
+# All four samples are filed in the same court
+NDCAL = 'United States District Court\nNorthern District of California'
 
 
 # Sample Brief 1: Motion to Dismiss - 12(b)(6) - Contract Case
 brief1 = {
-    'court': 'United States District Court\nNorthern District of California',
+    'court': NDCAL,
     'case_name': 'TECHSTART INNOVATIONS, INC., Plaintiff,\nv.\nGLOBAL VENTURES LLC, Defendant.',
     'case_number': '3:24-cv-01234-WHO',
     'document_title': "Defendant's Motion to Dismiss Pursuant to Fed. R. Civ. P. 12(b)(6)",
@@ -116,7 +207,7 @@ brief1 = {
 
 # Sample Brief 2: Opposition to Motion for Summary Judgment - Employment Discrimination
 brief2 = {
-    'court': 'United States District Court\nNorthern District of California',
+    'court': NDCAL,
     'case_name': 'MARIA SANTOS, Plaintiff,\nv.\nACME TECHNOLOGY CORPORATION, Defendant.',
     'case_number': '3:23-cv-05678-JST',
     'document_title': "Plaintiff's Opposition to Defendant's Motion for Summary Judgment",
@@ -175,7 +266,7 @@ brief2 = {
 
 # Sample Brief 3: Motion for Preliminary Injunction - Trade Secret
 brief3 = {
-    'court': 'United States District Court\nNorthern District of California',
+    'court': NDCAL,
     'case_name': 'NEXGEN PHARMACEUTICALS, INC., Plaintiff,\nv.\nDR. JAMES CHEN and BIOTECH SOLUTIONS LLC, Defendants.',
     'case_number': '3:24-cv-02468-EMC',
     'document_title': "Plaintiff's Motion for Preliminary Injunction",
@@ -236,7 +327,7 @@ brief3 = {
 
 # Sample Brief 4: Motion to Dismiss - Personal Jurisdiction
 brief4 = {
-    'court': 'United States District Court\nNorthern District of California',
+    'court': NDCAL,
     'case_name': 'PACIFIC COAST DISTRIBUTORS, INC., Plaintiff,\nv.\nMIDWEST MANUFACTURING CO., Defendant.',
     'case_number': '3:24-cv-03691-LB',
     'document_title': "Defendant's Motion to Dismiss for Lack of Personal Jurisdiction",
@@ -291,9 +382,33 @@ brief4 = {
 }
 
 
-if __name__ == "__main__":
-    create_brief("01_mtd_contract_global_ventures.docx", brief1)
-    create_brief("02_opp_summary_judgment_santos.docx", brief2)
-    create_brief("03_preliminary_injunction_nexgen.docx", brief3)
-    create_brief("04_mtd_personal_jurisdiction_midwest.docx", brief4)
+BRIEFS = [
+    ("01_mtd_contract_global_ventures.docx", brief1),
+    ("02_opp_summary_judgment_santos.docx", brief2),
+    ("03_preliminary_injunction_nexgen.docx", brief3),
+    ("04_mtd_personal_jurisdiction_midwest.docx", brief4),
+]
+
+
+def _create_brief(args: tuple[str, dict]) -> Path:
+    """Process pool worker: create one brief from a (filename, content) pair."""
+    return create_brief(*args)
+
+
+def main():
+    """Generate every sample brief into OUTPUT_DIR."""
+    # The briefs share nothing, so build them in parallel when there are
+    # spare cores; on a single core the pool is pure overhead
+    workers = min(len(BRIEFS), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            paths = list(executor.map(_create_brief, BRIEFS))
+    else:
+        paths = [_create_brief(brief) for brief in BRIEFS]
+    for path in paths:
+        print(f"Created: {path}")
     print("\nAll sample briefs generated successfully!")
+
+
+if __name__ == "__main__":
+    main()